@@ -24,27 +24,120 @@ Furthermore, the container-class OAIPMHRecord is defined. Objects of this
 class are used to exchange information between modules.
 
 
-[1] For the threaded execution of jobs, the threading-library is used.
-  Although the Job-class supports settings like pause, the threaded
-  execution is independent of this class, i.e. the Job-object and
-  Thread-object are controlled independently.
+[1] For the threaded execution of jobs, a thread pool of the
+  concurrent.futures-library is used. Although the Job-class supports
+  settings like pause, the threaded execution is independent of this
+  class, i.e. the Job-object and Future-object are controlled
+  independently.
 """
 
 import os
-from typing import Optional, Callable, TextIO
+import secrets
+import json
+import traceback
+from typing import Optional, Callable, TextIO, Iterator
 from pathlib import Path
 import threading
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from itertools import islice
+from time import monotonic
+from functools import partial
 from urllib import request
 
 import requests
 from dcm_common import LoggingContext as Context, Logger
 
-from oai_pmh_extractor.oaipmh_record import OAIPMHRecord
+from oai_pmh_extractor.oaipmh_record import OAIPMHRecord, File
 from oai_pmh_extractor.repository_interface import RepositoryInterface
 from oai_pmh_extractor.payload_collector import PayloadCollector
 from oai_pmh_extractor.job import Job
 
 
+def _throttle_progress_callback(
+    callback: Callable[[Job], None], interval: float
+) -> Callable[..., None]:
+    """
+    Returns wrapper for `callback` that skips calls which follow the
+    previous call within `interval` seconds. If a call has been skipped,
+    calling the wrapper with `flush=True` forces a call.
+    """
+
+    last_call = None
+    skipped = False
+    def _(job: Job, flush: bool = False) -> None:
+        nonlocal last_call, skipped
+        now = monotonic()
+        if (
+            last_call is None
+            or now - last_call >= interval
+            or (flush and skipped)
+        ):
+            last_call = now
+            skipped = False
+            callback(job)
+        else:
+            skipped = True
+    return _
+
+
+class _HarvestState():
+    """
+    Set of identifiers of the processed records of a job, which is backed
+    by a state-file (see `_state_path` of `ExtractionManager.harvest`).
+
+    Keyword arguments:
+    path -- path to the state-file; None disables the file
+    save_interval -- number of processed records between saves of the
+                     state-file
+    """
+
+    def __init__(self, path: Optional[Path], save_interval: int) -> None:
+        self._path = path
+        self._save_interval = save_interval
+        self._since_save = 0
+        self._lock = threading.Lock()
+        self.processed: set[str] = set()
+        if path is not None and path.is_file():
+            self.processed = set(
+                json.loads(path.read_text(encoding="utf-8"))["processed"]
+            )
+
+    def mark(self, identifier: str) -> None:
+        """Add `identifier` to the set of processed records."""
+
+        with self._lock:
+            self.processed.add(identifier)
+            self._since_save += 1
+            if self._since_save >= self._save_interval:
+                self._save()
+
+    def save(self) -> None:
+        """
+        Write state-file; the file is replaced atomically to not leave a
+        broken state behind on interruption.
+        """
+
+        with self._lock:
+            self._save()
+
+    def _save(self) -> None:
+        self._since_save = 0
+        if self._path is None:
+            return
+        tmp_path = self._path.with_name(self._path.name + ".tmp")
+        tmp_path.write_text(
+            json.dumps({"processed": sorted(self.processed)}),
+            encoding="utf-8"
+        )
+        os.replace(tmp_path, self._path)
+
+    def remove(self) -> None:
+        """Remove state-file."""
+
+        if self._path is not None:
+            self._path.unlink(missing_ok=True)
+
+
 class ExtractionManager():
     """
     Controller for the OAI-PMH- harvest and -extraction processes.
@@ -54,18 +147,48 @@ class ExtractionManager():
     payload_collector -- object of a PayloadCollector; required for
                          extraction-jobs
                          (default None)
+    harvest_workers -- number of worker threads per job used to execute
+                       GetRecord-requests concurrently
+                       (default 8)
+    download_workers -- number of worker threads per job used to download
+                        the files of a record concurrently
+                        (default 4)
+    url_workers -- number of worker threads per job used to collect
+                   transfer urls from the records' metadata concurrently
+                   (default 4)
+    max_jobs -- maximum number of jobs that are processed simultaneously;
+                additional jobs are queued; note that the threads of the
+                job pool are not daemonic, i.e. the interpreter only exits
+                after all submitted jobs have been processed (see `close`)
+                (default 8)
     """
 
+    # number of records processed between checks for abort during the
+    # collection of transfer urls
+    URL_BATCH_SIZE = 64
+    # number of harvested records between saves of the harvest state
+    STATE_SAVE_INTERVAL = 100
+
     def __init__(
         self,
         repository_interface: RepositoryInterface,
-        payload_collector: Optional[PayloadCollector] = None
+        payload_collector: Optional[PayloadCollector] = None,
+        harvest_workers: int = 8,
+        download_workers: int = 4,
+        url_workers: int = 4,
+        max_jobs: int = 8
     ) -> None:
         self._repository_interface = repository_interface
         self._payload_collector = payload_collector
+        self._harvest_workers = harvest_workers
+        self._download_workers = download_workers
+        self._url_workers = url_workers
         self._jobs: dict[str, Job] = {}
         self._running_threads_lock = threading.Lock()
-        self._running_threads: dict[str, tuple[threading.Thread, Callable[[], None]]] = {}
+        self._running_threads: dict[str, tuple[Future, Callable[[], None]]] = {}
+        self._job_pool = ThreadPoolExecutor(
+            max_workers=max_jobs, thread_name_prefix="oai-job"
+        )
         self.log: Logger = Logger(default_origin="OAI Extraction Manager")
 
     def get_job(self, identifier: str) -> Optional[Job]:
@@ -77,32 +200,33 @@ class ExtractionManager():
         identifier -- job identifier
         """
 
-        if identifier in self._jobs:
-            return self._jobs[identifier]
-        return None
+        return self._jobs.get(identifier)
 
     def abort_job(self, identifier: str) -> None:
         """
         Abort the job with a given job-identifier.
 
+        Aborting a job that is not running (anymore) has no effect.
+
         Keyword arguments:
         identifier -- job identifier
         """
 
-        if identifier in self._running_threads:
+        with self._running_threads_lock:
+            running_thread = self._running_threads.pop(identifier, None)
+        if running_thread is not None:
             self.log.log(
                 Context.INFO,
                 body=f"Aborted Job {identifier}."
             )
-            self._running_threads[identifier][1]()
-            del self._running_threads[identifier]
+            running_thread[1]()
 
     def _generate_unique_job_identifier(self):
         """Generate a unique job identifier."""
-        for retries in range(0, 100):
-            new_id = Job.generate_identifier(seed=str(retries))
-            if new_id not in self._jobs:
-                return new_id
+        # a random seed makes collisions practically impossible
+        new_id = Job.generate_identifier(seed=secrets.token_hex(8))
+        if new_id not in self._jobs:
+            return new_id
         # raise error on failure
         self.log.log(
             Context.ERROR,
@@ -114,12 +238,15 @@ class ExtractionManager():
         self,
         job: Job,
         job_task: Optional[Callable] = None
-    ) -> tuple[threading.Thread, Callable[[], None]]:
+    ) -> tuple[Future, Callable[[], None]]:
         """
-        Generate threading.Thread with given job-function.
+        Submit given job-function to the job pool.
+
+        Returns the Future and a callable-abort function (which also sets
+        the state of the associated job if it has not been started yet).
 
-        Returns the Thread and a callable-abort function (which also sets
-        the state of the associated job).
+        If job_task raises an exception, the error is logged and the job
+        is ended (aborted).
         """
 
         # register job
@@ -127,20 +254,52 @@ class ExtractionManager():
 
         # setup abort-event
         abort = threading.Event()
-        # define abort-callback
-        def abort_job():
-            abort.set()
-
-        # instantiate worker thread
-        worker = threading.Thread(target=job_task, daemon=True, args=(abort,))
-        self._running_threads[job.identifier] = worker, abort_job
-        worker.start()
+
+        # exceptions are not propagated by the job pool; handle them here
+        # since the Future is not evaluated
+        def run_job_task(abort_event: threading.Event) -> None:
+            try:
+                job_task(abort_event)
+            except Exception:
+                msg = f"Job {job.identifier} failed with an unexpected " \
+                    + f"error:\n{traceback.format_exc()}"
+                job.log.log(Context.ERROR, body=msg)
+                self.log.log(Context.ERROR, body=msg)
+                job.end(abort=True)
+            finally:
+                with self._running_threads_lock:
+                    self._running_threads.pop(job.identifier, None)
+
+        # submit task; hold lock to prevent the task from unregistering
+        # before it has been registered
+        with self._running_threads_lock:
+            worker = self._job_pool.submit(run_job_task, abort)
+            # define abort-callback
+            def abort_job():
+                abort.set()
+                # end jobs that are still queued right away
+                if worker.cancel():
+                    job.end(abort=True)
+            self._running_threads[job.identifier] = worker, abort_job
         self.log.log(
             Context.INFO,
             body=f"Started Job {job.identifier}."
         )
         return worker, abort_job
 
+    def close(self) -> None:
+        """
+        Shut down the job pool after all submitted jobs have been
+        processed.
+
+        This blocks until all jobs have finished (e.g., until pending
+        requests time out); abort running jobs first to return early.
+        The same applies to the exit of the interpreter if `close` is not
+        called.
+        """
+
+        self._job_pool.shutdown(wait=True)
+
     def harvest(
         self,
         metadata_prefix: str,
@@ -154,7 +313,11 @@ class ExtractionManager():
             = lambda job, event: None,
         _final_callback: Callable[[Job, threading.Event], None] \
             = lambda job, event: None,
-        _verbose_file: TextIO = open(os.devnull, "w")
+        _verbose_file: Optional[TextIO] = None,
+        _use_list_records: bool = True,
+        _progress_interval: float = 0,
+        _state_path: Optional[Path] = None,
+        _known: Optional[dict[str, str]] = None
     ) -> str:
         """
         Uses the RepositoryInterface to perform a metadata-harvest.
@@ -184,8 +347,79 @@ class ExtractionManager():
                                   (default lambda job, event: None)
         _final_callback -- callback for completed job
                            (default lambda job, event: None)
-        _verbose_file -- file for verbose output
-                         (default open(os.devnull, "w"))
+        _verbose_file -- file for verbose output; None disables verbose
+                         output
+                         (default None)
+        _use_list_records -- if True and _identifiers is not given,
+                             collect metadata using the ListRecords-verb
+                             instead of a combination of ListIdentifiers
+                             and individual GetRecord-requests
+                             (default True)
+        _progress_interval -- minimum interval between calls of
+                              _progress_callback in seconds; calls in
+                              between are skipped (the latest state is
+                              reported at the end of every phase)
+                              (default 0)
+        _state_path -- path to a JSON-file for storing the identifiers of
+                       harvested records; if the file exists, records
+                       listed therein are skipped, which allows to
+                       resume an interrupted harvest; records that are
+                       omitted by _filter are stored as well (i.e. a
+                       resumed job does not reconsider them, even with a
+                       different _filter); the file is removed once the
+                       job has completed
+                       (default None)
+        _known -- mapping of record identifiers to the datestamps of a
+                  previous harvest (see `OAIPMHRecord.datestamp`); records
+                  with an unchanged datestamp are skipped (not applicable
+                  if _identifiers is given)
+                  (default None)
+        """
+
+        return self._harvest(
+            metadata_prefix,
+            _identifiers,
+            _from,
+            _until,
+            _set_spec,
+            _filter,
+            _progress_callback,
+            _post_harvest_callback,
+            _final_callback,
+            _verbose_file,
+            _use_list_records,
+            _progress_interval,
+            _known,
+            state=_HarvestState(_state_path, self.STATE_SAVE_INTERVAL),
+            mark_harvested=True
+        )
+
+    def _harvest(
+        self,
+        metadata_prefix: str,
+        _identifiers: Optional[list[str]],
+        _from: Optional[str],
+        _until: Optional[str],
+        _set_spec: Optional[str],
+        _filter: Callable[[OAIPMHRecord], bool],
+        _progress_callback: Callable[[Job], None],
+        _post_harvest_callback: Callable[[Job, threading.Event], None],
+        _final_callback: Callable[[Job, threading.Event], None],
+        _verbose_file: Optional[TextIO],
+        _use_list_records: bool,
+        _progress_interval: float,
+        _known: Optional[dict[str, str]],
+        state: _HarvestState,
+        mark_harvested: bool
+    ) -> str:
+        """
+        Implementation of `harvest` (see there for the other arguments).
+
+        Keyword arguments:
+        state -- state of the processed records of this job
+        mark_harvested -- if False, records that pass _filter are not
+                          marked processed once harvested; this is left to
+                          _post_harvest_callback instead
         """
 
         self.log.log(
@@ -198,6 +432,15 @@ class ExtractionManager():
             _progress_callback = lambda job, event: None
         if _final_callback is None:
             _final_callback = lambda job, event: None
+        progress_callback = _throttle_progress_callback(
+            _progress_callback, _progress_interval
+        )
+        # skip formatting of frequent verbose output if it is discarded
+        verbose = _verbose_file is not None \
+            and getattr(_verbose_file, "name", None) != os.devnull
+        def vprint(*values: str) -> None:
+            if verbose:
+                print(*values, file=_verbose_file)
 
         # generate job-id
         job_id = self._generate_unique_job_identifier()
@@ -208,22 +451,57 @@ class ExtractionManager():
         )
         harvest_job.description=f"[{harvest_job.creation_datetime}] harvest job"
 
+        # load identifiers of records that have been harvested previously
+        # (the listing is always restarted from the beginning: its order
+        # is not specified by OAI-PMH, so the datestamps of processed
+        # records do not allow to derive a lower bound for _from)
+        processed_identifiers = state.processed
+        def mark_processed(record: OAIPMHRecord, omitted: bool) -> None:
+            # records that are kept are marked by the caller if requested
+            if mark_harvested or omitted:
+                state.mark(record.identifier)
+
+        # records with a datestamp matching that of a previous harvest
+        # are skipped
+        unchanged_records = 0
+        def is_unchanged(identifier: str, datestamp: Optional[str]) -> bool:
+            nonlocal unchanged_records
+            if _known is None or datestamp is None \
+                    or _known.get(identifier) != datestamp:
+                return False
+            unchanged_records += 1
+            return True
+        def report_unchanged(log_prefix: str) -> None:
+            if unchanged_records == 0:
+                return
+            msg = f"Skipped {unchanged_records} unchanged record(s)."
+            harvest_job.log.log(Context.INFO, body=msg)
+            vprint(log_prefix + msg)
+
         # build task for this job
-        def job_task(abort_event: threading.Event) -> None:
-            short_job_id = harvest_job.get_abbreviated_identifier()
-            print(f"[{short_job_id}] Starting harvest..", file=_verbose_file)
+        def harvest_task(abort_event: threading.Event) -> None:
+            log_prefix = f"[{harvest_job.get_abbreviated_identifier()}] "
+            vprint(log_prefix + "Starting harvest..")
             harvest_job.start()
+            if processed_identifiers:
+                vprint(
+                    log_prefix \
+                        + f"Skipping {len(processed_identifiers)} previously" \
+                        + " harvested record(s).."
+                )
             resumption_token = None
-            _progress_callback(harvest_job)
-            # get identifiers
-            if _identifiers is None:
+            bulk_harvest = _identifiers is None and _use_list_records
+            progress_callback(harvest_job)
+            # get records in bulk
+            if bulk_harvest:
+                vprint(log_prefix + "Collecting metadata..")
                 while True:
                     # make request
                     http_ok = True
                     try:
-                        response_list_of_identifiers, resumption_token = \
-                            self._repository_interface.list_identifiers(
-                                _metadata_prefix=metadata_prefix,
+                        response_list_of_records, resumption_token = \
+                            self._repository_interface.list_records_bulk(
+                                metadata_prefix=metadata_prefix,
                                 _from=_from,
                                 _until=_until,
                                 _set_spec=_set_spec,
@@ -233,152 +511,299 @@ class ExtractionManager():
                         # prepare error msg for log in case of httperror
                         http_ok = False
                         error_msg = str(exc_info)
+                    else:
+                        # check for and prepare error msg in case of
+                        # oai-error (see ListIdentifiers below)
+                        oai_ok = resumption_token is None \
+                            or len(response_list_of_records) > 0
+                    # handle exception
+                    if not http_ok or not oai_ok:
+                        if http_ok:
+                            error_msg = self._repository_interface.log_oneline()
+                        harvest_job.end(abort=True)
+                        vprint(
+                            log_prefix + "A problem occurred while trying" \
+                                + f" to execute ListRecords: '{error_msg}'"
+                        )
+                        vprint(log_prefix + "Aborted job.")
+                        return
+                    # process result
+                    for record in response_list_of_records:
+                        if record.identifier in processed_identifiers \
+                                or is_unchanged(
+                                    record.identifier, record.datestamp
+                                ):
+                            continue
+                        record.complete = True
+                        if not harvest_job.add_record(record):
+                            continue
+                        keep = _filter(record)
+                        mark_processed(record, not keep)
+                        if not keep:
+                            if verbose:
+                                vprint(
+                                    log_prefix \
+                                        + f"Omit record {record.identifier} due to filter."
+                                )
+                            harvest_job.omit_record(record, "Filter")
+                        else:
+                            harvest_job.log.log(
+                                Context.INFO,
+                                body=f"Record {record.identifier} marked complete."
+                            )
+                            if verbose:
+                                vprint(
+                                    log_prefix \
+                                        + f"Collected metadata for record {record.identifier}."
+                                )
+                    progress_callback(harvest_job)
+                    # exit loop if no token is returned; harvest complete
+                    if resumption_token is None:
+                        break
+                    vprint(
+                        log_prefix \
+                            + f"Got {len(response_list_of_records)} records," \
+                            + f" continuing with token {resumption_token}."
+                    )
+                    # exit-point: abort if requested
+                    if abort_event.is_set():
+                        harvest_job.end(abort=True)
+                        vprint(log_prefix + "Aborted job.")
+                        return
+                # check for log of RepositoryInterface
+                ri_log = self._repository_interface.log_oneline()
+                if ri_log != "":
+                    vprint(
+                        log_prefix + "Repository reported a problem:" \
+                            + f" '{ri_log}'"
+                    )
+                msg = f"Job is associated with {harvest_job.number_of_records} record(s)."
+                harvest_job.log.log(
+                    Context.INFO,
+                    body=msg
+                )
+                vprint(
+                    log_prefix \
+                        + f"Total number of records: {harvest_job.number_of_records}"
+                )
+                report_unchanged(log_prefix)
+            # get identifiers; in case of a ListIdentifiers-harvest, the
+            # pages are requested on demand while GetRecord-requests of
+            # previous pages are processed
+            listing_ok = True
+            def list_records_by_identifiers() -> Iterator[OAIPMHRecord]:
+                nonlocal listing_ok
+                resumption_token = None
+                while True:
+                    # make request
+                    http_ok = True
+                    try:
+                        if _known is None:
+                            response_list_of_identifiers, resumption_token = \
+                                self._repository_interface.list_identifiers(
+                                    _metadata_prefix=metadata_prefix,
+                                    _from=_from,
+                                    _until=_until,
+                                    _set_spec=_set_spec,
+                                    _resumption_token=resumption_token
+                                )
+                            page_size = len(response_list_of_identifiers)
+                        else:
+                            # datestamps are only required for _known
+                            response_list_of_headers, resumption_token = \
+                                self._repository_interface.list_headers(
+                                    _metadata_prefix=metadata_prefix,
+                                    _from=_from,
+                                    _until=_until,
+                                    _set_spec=_set_spec,
+                                    _resumption_token=resumption_token
+                                )
+                            response_list_of_identifiers = [
+                                identifier
+                                for identifier, datestamp
+                                in response_list_of_headers
+                                if not is_unchanged(identifier, datestamp)
+                            ]
+                            page_size = len(response_list_of_headers)
+                    except requests.RequestException as exc_info:
+                        # prepare error msg for log in case of httperror
+                        http_ok = False
+                        error_msg = str(exc_info)
                     else:
                         # check for and prepare error msg in case of
                         # oai-error
                         # (ListIdentifiers-verb yielding an OAIPMHerror
                         # implies the occurrence of a badResumptionToken)
-                        oai_ok = resumption_token is None \
-                            or len(response_list_of_identifiers) > 0
-                        error_msg = \
-                            str(self._repository_interface.log).replace("\n", " ")
+                        oai_ok = resumption_token is None or page_size > 0
                     # handle exception
                     if not http_ok or not oai_ok:
-                        harvest_job.end(abort=True)
-                        print(
-                            f"[{short_job_id}] A problem occurred while trying" \
-                                + f" to execute ListIdentifiers: '{error_msg}'",
-                            file=_verbose_file
+                        if http_ok:
+                            error_msg = self._repository_interface.log_oneline()
+                        listing_ok = False
+                        vprint(
+                            log_prefix + "A problem occurred while trying" \
+                                + f" to execute ListIdentifiers: '{error_msg}'"
                         )
-                        print(f"[{short_job_id}] Aborted job.", file=_verbose_file)
                         return
                     # process result
                     # add dummy records into list of records in job (for progress)
-                    for identifier in response_list_of_identifiers:
-                        harvest_job.add_record(OAIPMHRecord(identifier))
-                    _progress_callback(harvest_job)
+                    yield from harvest_job.extend_records(
+                        OAIPMHRecord(identifier)
+                        for identifier in response_list_of_identifiers
+                        if identifier not in processed_identifiers
+                    )
+                    progress_callback(harvest_job)
                     # exit loop if no token is returned; id-harvest complete
                     if resumption_token is None:
                         break
-                    print(
-                        f"[{short_job_id}] " \
+                    vprint(
+                        log_prefix \
                             + f"Got {len(response_list_of_identifiers)} identifiers," \
-                            + f" continuing with token {resumption_token}.",
-                        file=_verbose_file
+                            + f" continuing with token {resumption_token}."
                     )
-                    # exit-point: abort if requested
+                    # exit-point: abort if requested (handled by consumer)
                     if abort_event.is_set():
-                        harvest_job.end(abort=True)
-                        print(f"[{short_job_id}] Aborted job.", file=_verbose_file)
                         return
                 # check for log of RepositoryInterface
-                ri_log = \
-                    str(self._repository_interface.log).replace("\n", " ")
+                ri_log = self._repository_interface.log_oneline()
                 if ri_log != "":
-                    print(
-                        f"[{short_job_id}] Repository reported a problem:" \
-                            + f" '{ri_log}'",
-                        file=_verbose_file
+                    vprint(
+                        log_prefix + "Repository reported a problem:" \
+                            + f" '{ri_log}'"
                     )
+                msg = f"Job is associated with {harvest_job.number_of_records} identifier(s)."
+                harvest_job.log.log(
+                    Context.INFO,
+                    body=msg
+                )
+                vprint(
+                    log_prefix \
+                        + f"Total number of identifiers: {harvest_job.number_of_records}"
+                )
+                report_unchanged(log_prefix)
+            pending_records: Iterator[OAIPMHRecord]
+            if bulk_harvest:
+                pending_records = iter([])
+            elif _identifiers is None:
+                vprint(log_prefix + "Collecting metadata..")
+                pending_records = list_records_by_identifiers()
             else:
                 # add dummy records into list of records in job (for progress)
-                for identifier in _identifiers:
-                    harvest_job.add_record(OAIPMHRecord(identifier))
-                _progress_callback(harvest_job)
-                print(
-                    f"[{short_job_id}] " \
-                        + "Using given list of identifiers..",
-                    file=_verbose_file
+                harvest_job.extend_records(
+                    OAIPMHRecord(identifier) for identifier in _identifiers
+                    if identifier not in processed_identifiers
                 )
-            msg = f"Job is associated with {len(harvest_job.records)} identifier(s)."
-            harvest_job.log.log(
-                Context.INFO,
-                body=msg
-            )
-            print(
-                f"[{short_job_id}] " \
-                    + f"Total number of identifiers: {len(harvest_job.records)}",
-                file=_verbose_file
-            )
-            print(f"[{short_job_id}] Collecting metadata..", file=_verbose_file)
-            # get records
-            for record in harvest_job.records:
-                # make request
-                http_ok = True
-                full_record = None
+                progress_callback(harvest_job)
+                vprint(
+                    log_prefix \
+                        + "Using given list of identifiers.."
+                )
+                msg = f"Job is associated with {harvest_job.number_of_records} identifier(s)."
+                harvest_job.log.log(
+                    Context.INFO,
+                    body=msg
+                )
+                vprint(
+                    log_prefix \
+                        + f"Total number of identifiers: {harvest_job.number_of_records}"
+                )
+                vprint(log_prefix + "Collecting metadata..")
+                pending_records = iter(list(harvest_job.records))
+            # get records (already complete in case of bulk_harvest)
+            def fetch_record(
+                record: OAIPMHRecord
+            ) -> tuple[Optional[OAIPMHRecord], Optional[str]]:
+                # requests are executed concurrently; use separate log
+                # instead of the (shared) log of the RepositoryInterface
+                record_log = Logger(default_origin="OAI Repository Interface")
                 try:
                     full_record = self._repository_interface.get_record(
                         metadata_prefix=metadata_prefix,
-                        identifier=record.identifier
+                        identifier=record.identifier,
+                        _log=record_log
                     )
                 except requests.RequestException as exc_info:
                     # prepare error msg for log in case of httperror
-                    http_ok = False
-                    error_msg = str(exc_info)
-                if full_record is not None:
-                    # process result by copying data into dummy record
-                    record.status = full_record.status
-                    record.metadata_raw = full_record.metadata_raw
-                    record.metadata_prefix = full_record.metadata_prefix
-                    # mark as complete
-                    record.complete = True
-                    if not _filter(record):
-                        print(
-                            f"[{short_job_id}] " \
-                                + f"Omit record {record.identifier} due to filter.",
-                            file=_verbose_file
-                        )
-                        harvest_job.omit_record(record, "Filter")
-                    else:
-                        harvest_job.log.log(
-                            Context.INFO,
-                            body=f"Record {record.identifier} marked complete."
-                        )
-                        print(
-                            f"[{short_job_id}] " \
-                                + f"Collected metadata for record {record.identifier}.",
-                            file=_verbose_file
-                        )
-                else:
-                    record.complete = False
-                    if not http_ok:
-                        harvest_job.log.log(
-                            Context.ERROR,
-                            body="A problem occurred while trying to execute"
-                            + f" GetRecord for {record.identifier}: '{error_msg}'"
-                        )
-                        print(
-                            f"[{short_job_id}] " \
-                                + "A problem occurred while trying to execute" \
-                                + f" GetRecord for {record.identifier}: '{error_msg}'",
-                            file=_verbose_file
-                        )
-                    else:
-                        harvest_job.log.log(
-                            Context.ERROR,
-                            body=f"GetRecord for {record.identifier} returned error. \n"
-                                + str(self._repository_interface.log)
-                        )
-                        print(
-                            f"[{short_job_id}] " \
-                                + f"GetRecord for {record.identifier} returned error. \n" \
-                                + str(self._repository_interface.log),
-                            file=_verbose_file
-                        )
-                _progress_callback(harvest_job)
-                # exit-point: abort if requested
-                if abort_event.is_set():
-                    harvest_job.end(abort=True)
-                    print(f"[{short_job_id}] Aborted job.", file=_verbose_file)
-                    return
+                    return None, "A problem occurred while trying to execute" \
+                        + f" GetRecord for {record.identifier}: '{exc_info}'"
+                if full_record is None:
+                    # prepare error msg for log in case of oai-error
+                    return None, f"GetRecord for {record.identifier} returned" \
+                        + f" error. \n{record_log}"
+                return full_record, None
+            with ThreadPoolExecutor(
+                max_workers=self._harvest_workers
+            ) as executor:
+                # requests are submitted to the executor in chunks in
+                # order to limit the number of queued requests
+                pending: dict[Future, OAIPMHRecord] = {}
+                while True:
+                    for record in islice(
+                        pending_records, 2*self._harvest_workers - len(pending)
+                    ):
+                        pending[executor.submit(fetch_record, record)] = record
+                    if not pending:
+                        break
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        record = pending.pop(future)
+                        full_record, error_msg = future.result()
+                        if full_record is not None:
+                            # process result by copying data into dummy record
+                            record.status = full_record.status
+                            record.metadata_raw = full_record.metadata_raw
+                            record.metadata_prefix = full_record.metadata_prefix
+                            record.datestamp = full_record.datestamp
+                            # mark as complete
+                            record.complete = True
+                            keep = _filter(record)
+                            mark_processed(record, not keep)
+                            if not keep:
+                                if verbose:
+                                    vprint(
+                                        log_prefix \
+                                            + f"Omit record {record.identifier} due to filter."
+                                    )
+                                harvest_job.omit_record(record, "Filter")
+                            else:
+                                harvest_job.log.log(
+                                    Context.INFO,
+                                    body=f"Record {record.identifier} marked complete."
+                                )
+                                if verbose:
+                                    vprint(
+                                        log_prefix \
+                                            + f"Collected metadata for record {record.identifier}."
+                                    )
+                        else:
+                            # mypy - hint
+                            assert error_msg is not None
+                            record.complete = False
+                            harvest_job.log.log(
+                                Context.ERROR,
+                                body=error_msg
+                            )
+                            vprint(log_prefix + error_msg)
+                        progress_callback(harvest_job)
+                    # exit-point: abort if requested or listing failed
+                    if abort_event.is_set() or not listing_ok:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        harvest_job.end(abort=True)
+                        vprint(log_prefix + "Aborted job.")
+                        return
+            if abort_event.is_set() or not listing_ok:
+                harvest_job.end(abort=True)
+                vprint(log_prefix + "Aborted job.")
+                return
             harvest_job.log.log(
                 Context.INFO,
                 body="Harvest of metadata complete."
             )
+            progress_callback(harvest_job, flush=True)
             _post_harvest_callback(harvest_job, abort_event)
             if abort_event.is_set():
                 harvest_job.end(abort=True)
-                print(f"[{short_job_id}] Aborted job.", file=_verbose_file)
+                vprint(log_prefix + "Aborted job.")
                 return
             # job is finished
             harvest_job.end()
@@ -390,12 +815,22 @@ class ExtractionManager():
             _final_callback(harvest_job, abort_event)
             if abort_event.is_set():
                 harvest_job.end(abort=True)
-                print(f"[{short_job_id}] Aborted job.", file=_verbose_file)
+                vprint(log_prefix + "Aborted job.")
                 return
             # remove job reference from list of running threads
             with self._running_threads_lock:
-                del self._running_threads[harvest_job.identifier]
-            print(f"[{short_job_id}] Done.", file=_verbose_file)
+                self._running_threads.pop(harvest_job.identifier, None)
+            vprint(log_prefix + "Done.")
+
+        def job_task(abort_event: threading.Event) -> None:
+            try:
+                harvest_task(abort_event)
+            finally:
+                # keep state only for resuming an incomplete job
+                if harvest_job.complete:
+                    state.remove()
+                else:
+                    state.save()
 
         self._dispatch_job(harvest_job, job_task=job_task)
 
@@ -413,7 +848,11 @@ class ExtractionManager():
         _progress_callback: Callable[[Job], None] = lambda job: None,
         _final_callback: Callable[[Job, threading.Event], None] \
             = lambda job, event: None,
-        _verbose_file: TextIO = open(os.devnull, "w")
+        _verbose_file: Optional[TextIO] = None,
+        _use_list_records: bool = True,
+        _progress_interval: float = 0,
+        _state_path: Optional[Path] = None,
+        _known: Optional[dict[str, str]] = None
     ) -> str:
         """
         Uses the RepositoryInterface to perform a metadata-harvest
@@ -455,8 +894,35 @@ class ExtractionManager():
                               (default lambda job: None)
         _final_callback -- callback for completed job
                            (default lambda job: None)
-        _verbose_file -- file for verbose output
-                         (default open(os.devnull, "w"))
+        _verbose_file -- file for verbose output; None disables verbose
+                         output
+                         (default None)
+        _use_list_records -- if True and _identifiers is not given,
+                             collect metadata using the ListRecords-verb
+                             instead of a combination of ListIdentifiers
+                             and individual GetRecord-requests
+                             (default True)
+        _progress_interval -- minimum interval between calls of
+                              _progress_callback in seconds; calls in
+                              between are skipped (the latest state is
+                              reported at the end of every phase)
+                              (default 0)
+        _state_path -- path to a JSON-file for storing the identifiers of
+                       extracted records; a record is stored once all of
+                       its files have been downloaded; if the file
+                       exists, records listed therein are skipped, which
+                       allows to resume an interrupted extraction (the
+                       payload of a resumed job is put into a new job
+                       directory); records that are omitted by _filter
+                       are stored as well (i.e. a resumed job does not
+                       reconsider them, even with a different _filter);
+                       the file is removed once the job has completed
+                       (default None)
+        _known -- mapping of record identifiers to the datestamps of a
+                  previous harvest (see `OAIPMHRecord.datestamp`); records
+                  with an unchanged datestamp are skipped (not applicable
+                  if _identifiers is given)
+                  (default None)
         """
 
         self.log.log(
@@ -474,137 +940,190 @@ class ExtractionManager():
             )
             raise ValueError(msg)
 
+        progress_callback = _throttle_progress_callback(
+            _progress_callback, _progress_interval
+        )
+        # skip formatting of frequent verbose output if it is discarded
+        verbose = _verbose_file is not None \
+            and getattr(_verbose_file, "name", None) != os.devnull
+        def vprint(*values: str) -> None:
+            if verbose:
+                print(*values, file=_verbose_file)
+
+        # records are marked processed only after their payload has been
+        # downloaded (see extract_job)
+        state = _HarvestState(_state_path, self.STATE_SAVE_INTERVAL)
+
         # define extraction as _post_harvest_callback
         def extract_job(
             extraction_job: Job,
             abort_event: threading.Event
         ) -> None:
-            short_job_id = extraction_job.get_abbreviated_identifier()
+            log_prefix = f"[{extraction_job.get_abbreviated_identifier()}] "
             # iterate records to get transfer urls
-            found_anything = False
-            print(f"[{short_job_id}] Extracting payload..", file=_verbose_file)
-            for record in extraction_job.records:
+            def collect_urls(record: OAIPMHRecord) -> None:
                 # mypy - hint
                 assert self._payload_collector is not None
-                # collect urls
                 self._payload_collector.download_record_payload(
                     record=record,
                     renew_urls=True,
                     skip_download=True
                 )
-                if record.files:
-                    found_anything = True
-                extraction_job.log.log(
-                    Context.INFO,
-                    body=f"Registered {len(record.files)} file(s) for record "
-                        + f"{record.identifier}."
-                )
-                print(
-                    f"[{short_job_id}] Record {record.identifier} has " \
-                        + f"{len(record.files)} associated "\
-                        + f"file{'s'[:len(record.files)^1]}.",
-                    file=_verbose_file
-                )
-                _progress_callback(extraction_job)
-                if abort_event.is_set():
-                    extraction_job.end(abort=True)
-                    print(f"[{short_job_id}] Aborted job.", file=_verbose_file)
-                    return
+            found_anything = False
+            vprint(log_prefix + "Extracting payload..")
+            records = list(extraction_job.records)
+            with ThreadPoolExecutor(max_workers=self._url_workers) as executor:
+                for batch_start in range(0, len(records), self.URL_BATCH_SIZE):
+                    batch = records[batch_start:batch_start + self.URL_BATCH_SIZE]
+                    # collect urls
+                    list(executor.map(collect_urls, batch))
+                    # process results in order
+                    for record in batch:
+                        if record.files:
+                            found_anything = True
+                        else:
+                            # nothing to download
+                            state.mark(record.identifier)
+                        extraction_job.log.log(
+                            Context.INFO,
+                            body=f"Registered {len(record.files)} file(s) for record "
+                                + f"{record.identifier}."
+                        )
+                        if verbose:
+                            vprint(
+                                log_prefix + f"Record {record.identifier} has " \
+                                    + f"{len(record.files)} associated "\
+                                    + f"file{'s'[:len(record.files)^1]}."
+                            )
+                        progress_callback(extraction_job)
+                    if abort_event.is_set():
+                        extraction_job.end(abort=True)
+                        vprint(log_prefix + "Aborted job.")
+                        return
             extraction_job.log.log(
                 Context.INFO,
                 body="Collected all transfer-urls."
             )
-            _progress_callback(extraction_job)
+            progress_callback(extraction_job, flush=True)
+
+            # define download of individual file (executed concurrently)
+            verbose_lock = threading.Lock()
+            def download(record: OAIPMHRecord, file: File) -> None:
+                # skip if abort has been requested in the meantime
+                if abort_event.is_set():
+                    file["complete"] = False
+                    return
+                if verbose:
+                    with verbose_lock:
+                        vprint(
+                            log_prefix + f"Downloading file {file['url']}"
+                        )
+                # mypy - hint
+                assert self._payload_collector is not None
+                assert record.path is not None
+                # perform download
+                file_ok = True
+                error_msg = ""
+                try:
+                    file["path"] = self._payload_collector.download_file(
+                        record.path, file["url"]
+                    )
+                except (request.URLError, OSError, FileExistsError) \
+                        as exc_info:
+                    # prepare error msg for log in case of urlerror
+                    file_ok = False
+                    error_msg = str(exc_info)
+                with verbose_lock:
+                    if file_ok:
+                        file["complete"] = file["path"].is_file()
+                        if file["complete"]:
+                            extraction_job.log.log(
+                                Context.INFO,
+                                body=f"Downloaded file {file['url']} associated "
+                                    + f"with record {record.identifier}."
+                            )
+                        else:
+                            extraction_job.log.log(
+                                Context.INFO,
+                                body="A problem occurred while getting file "
+                                    + f"{file['url']} associated with"
+                                    + f" record {record.identifier}."
+                            )
+                    else:
+                        file["complete"] = False
+                        extraction_job.log.log(
+                            Context.INFO,
+                            body=f"Download failed: {error_msg}."
+                        )
+                        vprint(
+                            log_prefix \
+                                + f"Failed to download {file['url']} associated " \
+                                + f"with record {record.identifier}: " \
+                                + error_msg
+                        )
 
             # prepare directories
             if found_anything:
-                (path / extraction_job.identifier).mkdir(parents=True)
+                job_dir = path / extraction_job.identifier
+                job_dir.mkdir(parents=True)
 
                 # iterate records to download files
-                for record in extraction_job.records:
-                    if isinstance(record.files, list):
-                        record.path = None
-                        seed = 0
-                        while record.path is None or record.path.is_dir():
-                            record.path = \
-                                path \
-                                    / extraction_job.identifier \
-                                    / (f"{record.identifier_hash}-" \
-                                        + f"{Job.generate_identifier(str(seed))[0:9]}")
-                            seed += 1
-                        if len(record.files) > 0:
-                            record.path.mkdir(parents=True, exist_ok=False)
-                        for file in record.files:
-                            print(
-                                f"[{short_job_id}] Downloading file {file['url']}",
-                                file=_verbose_file
-                            )
-                            # mypy - hint
-                            assert self._payload_collector is not None
-                            # perform download
-                            file_ok = True
-                            error_msg = ""
-                            try:
-                                file["path"] = self._payload_collector.download_file(
-                                    record.path, file["url"]
+                with ThreadPoolExecutor(
+                    max_workers=self._download_workers
+                ) as executor:
+                    for record in extraction_job.records:
+                        if isinstance(record.files, list):
+                            # use random suffix; regenerate on collision
+                            while True:
+                                record.path = job_dir / (
+                                    f"{record.identifier_hash}-"
+                                    + secrets.token_hex(5)
                                 )
-                            except (request.URLError, OSError, FileExistsError) \
-                                    as exc_info:
-                                # prepare error msg for log in case of urlerror
-                                file_ok = False
-                                error_msg = str(exc_info)
-                            if file_ok:
-                                file["complete"] = file["path"].is_file()
-                                if file["complete"]:
-                                    extraction_job.log.log(
-                                        Context.INFO,
-                                        body=f"Downloaded file {file['url']} associated "
-                                            + f"with record {record.identifier}."
-                                    )
-                                else:
-                                    extraction_job.log.log(
-                                        Context.INFO,
-                                        body="A problem occurred while getting file "
-                                            + f"{file['url']} associated with"
-                                            + f" record {record.identifier}."
-                                    )
-                            else:
-                                file["complete"] = False
-                                extraction_job.log.log(
-                                    Context.INFO,
-                                    body=f"Download failed: {error_msg}."
+                                if len(record.files) == 0:
+                                    break
+                                try:
+                                    record.path.mkdir(exist_ok=False)
+                                except FileExistsError:
+                                    continue
+                                break
+                            list(
+                                executor.map(
+                                    partial(download, record), record.files
                                 )
-                                print(
-                                    f"[{short_job_id}] " \
-                                        + f"Failed to download {file['url']} associated " \
-                                        + f"with record {record.identifier}: " \
-                                        + error_msg,
-                                    file=_verbose_file
-                                )
-                        _progress_callback(extraction_job)
-                    if abort_event.is_set():
-                        extraction_job.end(abort=True)
-                        print(f"[{short_job_id}] Aborted job.", file=_verbose_file)
-                        return
+                            )
+                            if record.files and all(
+                                file["complete"] for file in record.files
+                            ):
+                                state.mark(record.identifier)
+                            progress_callback(extraction_job)
+                        if abort_event.is_set():
+                            extraction_job.end(abort=True)
+                            vprint(log_prefix + "Aborted job.")
+                            return
             extraction_job.log.log(
                 Context.INFO,
                 body="Extraction complete."
             )
-            print(f"[{short_job_id}] Extraction complete.", file=_verbose_file)
-            _progress_callback(extraction_job)
+            vprint(log_prefix + "Extraction complete.")
+            progress_callback(extraction_job, flush=True)
             return
 
-        thread_id = self.harvest(
-            metadata_prefix=metadata_prefix,
-            _identifiers=_identifiers,
-            _from=_from,
-            _until=_until,
-            _set_spec=_set_spec,
-            _filter=_filter,
-            _progress_callback=_progress_callback,
-            _post_harvest_callback=extract_job,
-            _final_callback=_final_callback,
-            _verbose_file=_verbose_file
+        thread_id = self._harvest(
+            metadata_prefix,
+            _identifiers,
+            _from,
+            _until,
+            _set_spec,
+            _filter,
+            _progress_callback,
+            extract_job,
+            _final_callback,
+            _verbose_file,
+            _use_list_records,
+            _progress_interval,
+            _known,
+            state=state,
+            mark_harvested=False
         )
 
         return thread_id
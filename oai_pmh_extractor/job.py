@@ -6,10 +6,13 @@ Summary:
 * control job-state and generate metadata:
     start(), pause(), resume(), and end()
 * available properties:
-    identifier, complete, records, description, running, creation_datetime,
-    start_datetime, complete_datetime, and omitted_records
-* add records with: add_record(record), add_omitted_record(record)
+    identifier, complete, records, number_of_records, description, running,
+    creation_datetime, start_datetime, complete_datetime, and
+    omitted_records
+* add records with: add_record(record), extend_records(records),
+  add_omitted_record(record)
 * omit already listed records with: omit_record(record)
+* block until the Job has ended with: wait(timeout)
 
 In order to generate additional metadata, the methods start(), pause(),
 resume(), and end() can be used. Available properties are: identifier,
@@ -22,15 +25,21 @@ to be added/moved using the methods add_record(..), add_omitted_record(..),
 or omit_record(..), respectively.
 """
 
-from typing import Optional
-import sys
+from typing import Optional, Iterable
+import threading
 from datetime import datetime
+from hashlib import blake2b
 
 from dcm_common import LoggingContext as Context, Logger
 
 from oai_pmh_extractor.oaipmh_record import OAIPMHRecord
 
 
+def _now_str() -> str:
+    """Returns current UTC-datetime formatted as 'YYYY-MM-DD HH:MM:SS'."""
+    return datetime.utcnow().isoformat(sep=" ", timespec="seconds")
+
+
 class Job():
     """
     Record-class storing information regarding a harvest Job.
@@ -42,25 +51,46 @@ class Job():
                    (default "")
     """
 
-    _DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+    __slots__ = (
+        "_identifier",
+        "_complete",
+        "_records",
+        "_records_list",
+        "_description",
+        "_running",
+        "_paused",
+        "_creation_datetime",
+        "_start_datetime",
+        "_complete_datetime",
+        "_ended",
+        "_omitted_records",
+        "_omitted_record_ids",
+        "_log",
+    )
 
     JOB_TAG = "OAI JOB"
 
     def __init__(self, identifier: str, description: str = "") -> None:
         self._identifier = identifier
         self._complete = False
-        self._records: list[OAIPMHRecord] = []
+        # records are indexed by identifier; the list returned by the
+        # records-property is cached until a record is removed
+        self._records: dict[str, OAIPMHRecord] = {}
+        self._records_list: Optional[list[OAIPMHRecord]] = []
 
         # displayed description
         self._description = description
         # more job metadata
         self._running = False
         self._paused = False
-        self._creation_datetime = datetime.utcnow().strftime(self._DATETIME_FORMAT)
+        self._creation_datetime = _now_str()
         self._start_datetime = "not started"
         self._complete_datetime = "not completed"
+        # set when the Job ends (completed or aborted)
+        self._ended = threading.Event()
         # track records that are filtered out during harvest
         self._omitted_records: list[OAIPMHRecord] = []
+        self._omitted_record_ids: set[str] = set()
 
         self._log: Logger = Logger(default_origin=self.JOB_TAG)
         msg = f"Job {self._identifier} created."
@@ -86,7 +116,7 @@ class Job():
     def end(self, abort: bool = False) -> None:
         """Set Job to completed-state."""
 
-        self._complete_datetime = datetime.utcnow().strftime(self._DATETIME_FORMAT)
+        self._complete_datetime = _now_str()
         self._running = False
         self._complete = not abort
         msg = "Job ended. " + ("(Reason: Abort)" if abort else "(Reason: Done)")
@@ -94,11 +124,46 @@ class Job():
             Context.INFO,
             body=msg
         )
+        self._ended.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the Job has ended (see `end`) or the timeout expired.
+
+        Returns True if the Job has ended.
+
+        Keyword arguments:
+        timeout -- timeout duration in seconds; None indicates waiting
+                   indefinitely
+                   (default None)
+        """
+
+        return self._ended.wait(timeout)
 
     @property
     def records(self) -> list[OAIPMHRecord]:
         """Job records property."""
-        return self._records
+        if self._records_list is None:
+            self._records_list = list(self._records.values())
+        return self._records_list
+
+    @property
+    def number_of_records(self) -> int:
+        """
+        Job number_of_records property.
+
+        Equivalent to `len(records)` but, unlike the records-property,
+        does not need to rebuild the list of records after a record has
+        been omitted (e.g. for frequent progress reports).
+        """
+        return len(self._records)
+
+    def _reject_existing_record(self, record: OAIPMHRecord) -> None:
+        msg = f"Tried to add existing record ({record.identifier})."
+        self._log.log(
+            Context.ERROR,
+            body=msg
+        )
 
     def add_record(self, record: OAIPMHRecord) -> bool:
         """
@@ -109,25 +174,46 @@ class Job():
         """
 
         # check whether record id already exists
-        for _record in self._records:
-            if _record.identifier == record.identifier:
-                msg = f"Tried to add existing record ({record.identifier})."
-                self._log.log(
-                    Context.ERROR,
-                    body=msg
-                )
-                print(
-                    f"Job {self._identifier}: " + msg,
-                    file=sys.stderr
-                )
-                return False
+        if record.identifier in self._records:
+            self._reject_existing_record(record)
+            return False
         self._log.log(
             Context.INFO,
             body=f"Add record {record.identifier}."
         )
-        self._records.append(record)
+        self._records[record.identifier] = record
+        if self._records_list is not None:
+            self._records_list.append(record)
         return True
 
+    def extend_records(
+        self, records: Iterable[OAIPMHRecord]
+    ) -> list[OAIPMHRecord]:
+        """
+        Add multiple records to job.
+
+        Returns list of the records that have been added (records with
+        an identifier that already exists are skipped).
+
+        Keyword arguments:
+        records -- iterable of OAIPMHRecord-objects to be added to the job
+        """
+
+        added_records = []
+        for record in records:
+            if record.identifier in self._records:
+                self._reject_existing_record(record)
+                continue
+            self._log.log(
+                Context.INFO,
+                body=f"Add record {record.identifier}."
+            )
+            self._records[record.identifier] = record
+            added_records.append(record)
+        if self._records_list is not None:
+            self._records_list.extend(added_records)
+        return added_records
+
     @property
     def description(self) -> str:
         """Job description property."""
@@ -147,9 +233,10 @@ class Job():
         """Set Job to running-state."""
 
         if not self._running and not self._paused:
-            self._start_datetime = datetime.utcnow().strftime(self._DATETIME_FORMAT)
+            self._start_datetime = _now_str()
             self._running = True
             self._complete = False
+            self._ended.clear()
             self._log.log(
                 Context.INFO,
                 body="Start Job."
@@ -159,8 +246,6 @@ class Job():
                 Context.ERROR,
                 body="Attempt at starting Job while already in running state."
             )
-            print(f"Job {self._identifier} has already been started:" \
-                + "Cannot start. (Use resume() instead.)", file=sys.stderr)
 
     def pause(self) -> None:
         """Set Job to paused-state."""
@@ -178,8 +263,6 @@ class Job():
                 Context.ERROR,
                 body="Attempt at pausing Job which has not been started."
             )
-            print(f"Job {self._identifier} has not been started:" \
-                + "Cannot pause.", file=sys.stderr)
 
     def resume(self) -> None:
         """Reset Job to running-state."""
@@ -197,8 +280,6 @@ class Job():
                 Context.ERROR,
                 body="Attempt at resuming Job which has not been paused."
             )
-            print(f"Job {self._identifier} has not been started:" \
-                + "Cannot resume. (Use start() instead.)", file=sys.stderr)
 
     @property
     def creation_datetime(self) -> str:
@@ -235,18 +316,14 @@ class Job():
         """
 
         # check whether record id already exists
-        for _record in self._omitted_records:
-            if _record.identifier == record.identifier:
-                msg = f"Tried to omit existing record ({record.identifier})."
-                self._log.log(
-                    Context.ERROR,
-                    body=msg
-                )
-                print(
-                    f"Job {self._identifier}: " + msg,
-                    file=sys.stderr
-                )
-                return False
+        if record.identifier in self._omitted_record_ids:
+            msg = f"Tried to omit existing record ({record.identifier})."
+            self._log.log(
+                Context.ERROR,
+                body=msg
+            )
+            return False
+        self._omitted_record_ids.add(record.identifier)
         self._omitted_records.append(record)
         self._log.log(
             Context.INFO,
@@ -270,18 +347,12 @@ class Job():
         """
 
         # look for target record to be moved
-        target_record = None
-        for _record in self._records:
-            if _record.identifier == record.identifier:
-                target_record = record
-                break
+        target_record = self._records.pop(record.identifier, None)
         if target_record is not None:
-            # rebuild records-list
-            self._records = [
-                r for r in self._records
-                    if r.identifier != target_record.identifier
-            ]
+            # invalidate records-list
+            self._records_list = None
             # append record to omitted-records-list
+            self._omitted_record_ids.add(target_record.identifier)
             self._omitted_records.append(target_record)
             self._log.log(
                 Context.INFO,
@@ -295,11 +366,6 @@ class Job():
             Context.ERROR,
             body=msg
         )
-        print(
-            f"Job {self._identifier}: " \
-                + msg,
-            file=sys.stderr
-        )
         return False
 
     @property
@@ -310,9 +376,10 @@ class Job():
     @staticmethod
     def generate_identifier(seed: str) -> str:
         """Generate (unique) identifier for Job-object."""
-        from hashlib import sha256
 
-        string = datetime.utcnow().strftime(seed + "%Y-%m-%d %H:%M:%S.%f")
-        return sha256(
-            string.encode(encoding="utf-8")
+        string = seed + datetime.utcnow().isoformat(
+            sep=" ", timespec="microseconds"
+        )
+        return blake2b(
+            string.encode(encoding="utf-8"), digest_size=32
         ).hexdigest()
@@ -35,25 +35,44 @@ class OAIPMHRecord():
     file_urls -- list of urls to payload files; this can be used to initialize
                  a list of File-objects with urls at instantiation
                  (default None)
+    datestamp -- datestamp of record as given in its oai-pmh header
+                 (default None)
     """
 
+    __slots__ = (
+        "_identifier",
+        "_identifier_hash",
+        "_path",
+        "_status",
+        "_metadata_raw",
+        "_metadata_prefix",
+        "_datestamp",
+        "_files",
+        "_files_list",
+        "_complete",
+    )
+
     def __init__(
         self,
         identifier: str,
         status: str = "",
         metadata_prefix: Optional[str] = None,
         metadata_raw: Optional[str] = None,
-        file_urls: Optional[list[str]] = None
+        file_urls: Optional[list[str]] = None,
+        datestamp: Optional[str] = None
     ) -> None:
         self._identifier = identifier
-        self._identifier_hash: str = md5(
-                self._identifier.encode(encoding="utf-8")
-            ).hexdigest()
+        # identifier_hash is computed on first access
+        self._identifier_hash: Optional[str] = None
         self._path: Optional[Path] = None
         self._status = status
         self._metadata_raw = metadata_raw
         self._metadata_prefix = metadata_prefix
-        self._files: list[File] = []
+        self._datestamp = datestamp
+        # files are indexed by their identifier; the list returned by the
+        # files-property is cached until a file is removed or replaced
+        self._files: dict[str, File] = {}
+        self._files_list: Optional[list[File]] = []
         if file_urls is not None:
             self.register_files_by_url(file_urls)
         self._complete = False
@@ -65,8 +84,9 @@ class OAIPMHRecord():
         Keyword arguments:
         file_urls -- list of urls
         """
-        for url in file_urls:
-            self._files.append(
+        self._files.update(
+            (
+                url,
                 {
                     "identifier": url,
                     "url": url,
@@ -74,6 +94,9 @@ class OAIPMHRecord():
                     "complete": False
                 }
             )
+            for url in file_urls
+        )
+        self._files_list = None
 
     @property
     def identifier(self) -> str:
@@ -83,10 +106,15 @@ class OAIPMHRecord():
     @identifier.setter
     def identifier(self, value: str) -> None:
         self._identifier = value
+        self._identifier_hash = None
 
     @property
     def identifier_hash(self) -> str:
         """OAIPMHRecord identifier_hash property."""
+        if self._identifier_hash is None:
+            self._identifier_hash = md5(
+                self._identifier.encode(encoding="utf-8")
+            ).hexdigest()
         return self._identifier_hash
 
     @property
@@ -125,14 +153,28 @@ class OAIPMHRecord():
     def metadata_raw(self, value: str) -> None:
         self._metadata_raw = value
 
+    @property
+    def datestamp(self) -> Optional[str]:
+        """OAIPMHRecord datestamp property."""
+        return self._datestamp
+
+    @datestamp.setter
+    def datestamp(self, value: str) -> None:
+        self._datestamp = value
+
     @property
     def files(self) -> list[File]:
         """OAIPMHRecord files property."""
-        return self._files
+        if self._files_list is None:
+            self._files_list = list(self._files.values())
+        return self._files_list
 
     @files.setter
-    def files(self, value: list[File]) -> None:
-        self._files = value
+    def files(self, value: Optional[list[File]]) -> None:
+        self._files = {
+            file["identifier"]: file for file in (value or [])
+        }
+        self._files_list = None
 
     @property
     def complete(self) -> bool:
@@ -145,15 +187,21 @@ class OAIPMHRecord():
 
     def add_file(self, file: File) -> list[File]:
         """
-        Add file to list of files in record.
+        Add file to list of files in record. A file with the same
+        identifier that is already listed is replaced.
 
         Keyword arguments:
         file -- file represented by TypedDict-compliant dictionary to be
                 added to list of associated files
         """
 
-        self._files.append(file)
-        return self._files
+        if file["identifier"] in self._files:
+            # invalidate files-list
+            self._files_list = None
+        elif self._files_list is not None:
+            self._files_list.append(file)
+        self._files[file["identifier"]] = file
+        return self.files
 
     def remove_file(self, file: File) -> list[File]:
         """
@@ -164,8 +212,7 @@ class OAIPMHRecord():
                 removed from list of associated files
         """
 
-        self._files = [
-            x for x in self._files
-              if x["identifier"] != file["identifier"]
-        ]
-        return self._files
+        if self._files.pop(file["identifier"], None) is not None:
+            # invalidate files-list
+            self._files_list = None
+        return self.files
@@ -11,16 +11,151 @@ collection of filter factories:
 * filter_by_regex_in_xml_path
 """
 
-from typing import Optional, Callable
+from typing import Optional, Callable, Iterator, Any
 import sys
+import threading
+import re
+from contextlib import contextmanager
+from email.message import Message
+from functools import partial
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from urllib import request, parse
 from time import sleep
 
-from dcm_common.util import value_from_dict_path
+import requests
+from requests.adapters import HTTPAdapter
+from lxml import etree
 from dcm_common import LoggingContext as Context, Logger
 
-from oai_pmh_extractor.oaipmh_record import OAIPMHRecord
+from oai_pmh_extractor.oaipmh_record import OAIPMHRecord, File
+
+
+# documents parsed by the current thread within `_shared_xml_parse`
+_parse_scope = threading.local()
+
+
+@contextmanager
+def _shared_xml_parse() -> Iterator[None]:
+    """
+    Context manager within which the xml-based filters of
+    TransferUrlFilters that are called by the current thread share the
+    parsed documents (used while applying all filters to a record).
+    Nested use joins the enclosing scope.
+    """
+
+    if getattr(_parse_scope, "documents", None) is not None:
+        yield
+        return
+    _parse_scope.documents = {}
+    try:
+        yield
+    finally:
+        _parse_scope.documents = None
+
+
+def _scoped_cache(source_metadata: str) -> Optional[dict[str, Any]]:
+    """
+    Returns cache for results derived from the given document if called
+    within `_shared_xml_parse` (otherwise None).
+    """
+
+    documents = getattr(_parse_scope, "documents", None)
+    if documents is None:
+        return None
+    return documents.setdefault(source_metadata, {})
+
+
+def _parse_xml(source_metadata: str) -> etree._ElementTree:
+    """
+    Returns parsed xml document. Within `_shared_xml_parse`, the result
+    is reused for the same document (the returned tree must not be
+    modified).
+
+    Keyword arguments:
+    source_metadata -- xml document
+    """
+
+    cache = _scoped_cache(source_metadata)
+    if cache is not None and "tree" in cache:
+        return cache["tree"]
+    # the document has already been decoded, so any declared encoding
+    # needs to be overridden
+    tree = etree.ElementTree(
+        etree.fromstring(
+            source_metadata.encode("utf-8"),
+            etree.XMLParser(encoding="utf-8")
+        )
+    )
+    if cache is not None:
+        cache["tree"] = tree
+    return tree
+
+
+def _collect_namespaces(source_metadata: str) -> dict[str, str]:
+    """
+    Returns map of all namespace prefixes declared in xml document
+    (default namespace is mapped from ""). Like `_parse_xml`, the result
+    is reused within `_shared_xml_parse` (the returned map must not be
+    modified).
+
+    Keyword arguments:
+    source_metadata -- xml document
+    """
+
+    cache = _scoped_cache(source_metadata)
+    if cache is not None and "nsmap" in cache:
+        return cache["nsmap"]
+    nsmap = {}
+    for ns in _parse_xml(source_metadata).xpath("//namespace::*"):
+        if ns[0] not in nsmap:
+            nsmap["" if ns[0] is None else ns[0]] = ns[1]
+    if cache is not None:
+        cache["nsmap"] = nsmap
+    return nsmap
+
+
+def _find_text_by_xml_path(source_metadata: str, xml_path: list[str]) \
+        -> list[str]:
+    """
+    Returns texts of all elements at given path in xml. Path elements
+    are element names as written in the document (including a namespace
+    prefix, if any); the last path element may also select an attribute
+    ("@<name>").
+
+    Keyword arguments:
+    source_metadata -- xml document
+    xml_path -- path in xml relative to root
+    """
+
+    def name(element: etree._Element) -> str:
+        localname = etree.QName(element).localname
+        if element.prefix is None:
+            return localname
+        return f"{element.prefix}:{localname}"
+
+    root = _parse_xml(source_metadata).getroot()
+    if not xml_path or name(root) != xml_path[0]:
+        return []
+    elements = [root]
+    for key in xml_path[1:]:
+        if key.startswith("@"):
+            return [
+                element.get(key[1:]) for element in elements
+                if element.get(key[1:]) is not None
+            ]
+        if key == "#text":
+            break
+        elements = [
+            child for element in elements for child in element
+            if isinstance(child.tag, str) and name(child) == key
+        ]
+    # strip surrounding whitespace (e.g., from indentation) like xmltodict
+    # did; whitespace-only texts are omitted
+    return [
+        element.text.strip() for element in elements
+        if element.text is not None and element.text.strip()
+    ]
 
 
 class TransferUrlFilters:
@@ -36,17 +171,15 @@ class TransferUrlFilters:
         regex -- regex for filtering
         """
 
-        from re import findall
+        pattern = re.compile(regex)
 
         def _(source_metadata: Optional[str]) -> list[str]:
             if source_metadata is None:
                 return []
-            urls = []
-            matches = findall(regex, source_metadata)
-            if matches is not None:
-                # reject empty matches
-                urls.extend(list(filter(None, matches)))
-            return urls
+            # reject empty matches
+            return [
+                match for match in pattern.findall(source_metadata) if match
+            ]
 
         return _
 
@@ -63,28 +196,17 @@ class TransferUrlFilters:
         xml_path -- path in xml relative to root
         """
 
-        from re import findall
-
-        import xmltodict
+        pattern = re.compile(regex)
 
         def _(source_metadata: Optional[str]) -> list[str]:
             if source_metadata is None:
                 return []
-            urls = []
-            metadata_fields = value_from_dict_path(
-                xmltodict.parse(source_metadata),
-                xml_path
-            )
-            if metadata_fields is not None:
-                if isinstance(metadata_fields, str):
-                    metadata_fields = [metadata_fields]
-                for x in metadata_fields:
-                    if x is not None:
-                        matches = findall(regex, x)
-                        if matches is not None:
-                            # reject empty matches
-                            urls.extend(list(filter(None, matches)))
-            return urls
+            # reject empty matches
+            return [
+                match
+                for x in _find_text_by_xml_path(source_metadata, xml_path)
+                for match in pattern.findall(x) if match
+            ]
 
         return _
 
@@ -102,33 +224,23 @@ class TransferUrlFilters:
         path -- xpath query
         """
 
-        from re import findall
-        import xml.etree.ElementTree as ET
-        from io import BytesIO
-
-        from lxml import etree
+        pattern = re.compile(regex)
 
         def _(source_metadata: Optional[str]) -> list[str]:
             if source_metadata is None:
                 return []
             urls = []
 
-            # Get the namespaces
-            context = etree.parse(BytesIO(str.encode(source_metadata)))
-            nsmap = {}
-            for ns in context.xpath("//namespace::*"):
-                if ns[0] not in nsmap:
-                    nsmap["" if ns[0] is None else ns[0]] = ns[1]
-
-            # use xml library with xpath_query
+            # use ElementPath with xpath_query
             # (lxml supports no empty namespace prefix in XPath)
-            metadata_elements = ET.ElementTree(
-                ET.fromstring(source_metadata)
-            ).findall(path, nsmap)
+            with _shared_xml_parse():
+                metadata_elements = _parse_xml(source_metadata).findall(
+                    path, _collect_namespaces(source_metadata)
+                )
 
             for x in metadata_elements:
                 if x.text is not None:
-                    matches = findall(regex, x.text)
+                    matches = pattern.findall(x.text)
                     if matches is not None:
                         # reject empty matches
                         urls.extend(list(filter(None, matches)))
@@ -157,8 +269,17 @@ class PayloadCollector():
                       (default 1)
     retry_on_http_status -- http status codes for which retries should be made
                             (default None, uses: [429, 503])
+    download_workers -- maximum number of files of a record that are
+                        downloaded concurrently in download_record_payload
+                        (default 4)
+    max_connections -- maximum number of connections per host that are
+                       kept open for reuse
+                       (default 10)
     """
 
+    # buffer size in bytes used when writing downloaded payload to disk
+    DOWNLOAD_CHUNK_SIZE = 1 << 20
+
     def __init__(
         self,
         transfer_url_filter: Optional[
@@ -171,9 +292,11 @@ class PayloadCollector():
         max_retries: int = 1,
         retry_interval: float = 1.0,
         retry_on_http_status: Optional[list[int]] = None,
+        download_workers: int = 4,
+        max_connections: int = 10,
     ) -> None:
-        exclusive_kwargs = [transfer_url_filters, transfer_url_filter]
-        if all(exclusive_kwargs) or not any(exclusive_kwargs):
+        # mutually exclusive kwargs (an empty list counts as not given)
+        if bool(transfer_url_filters) == bool(transfer_url_filter):
             raise TypeError(
                 "Cannot instantiate 'PayloadCollector' with given args. "
                 + "Exactly one of the kwargs 'transfer_url_filters' and "
@@ -191,7 +314,76 @@ class PayloadCollector():
             if retry_on_http_status is None
             else retry_on_http_status
         )
+        self._download_workers = download_workers
         self.log: Logger = Logger(default_origin="Payload Collector")
+        # http(s)-connections are reused across downloads
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=max_connections, pool_maxsize=max_connections
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    @contextmanager
+    def _open_url(self, url: str) \
+            -> Iterator[tuple[str, Optional[str], Iterator[bytes]]]:
+        """
+        Open url for download. http(s)-urls are requested via the
+        requests-library (reusing connections), other urls via urllib.
+
+        Yields tuple of the final url (after redirects), the filename
+        given in the response header (if available), and an iterator of
+        the response body in chunks. Errors are raised in the format of
+        urllib (`request.HTTPError`, `request.URLError`, or
+        `TimeoutError`).
+
+        Keyword arguments:
+        url -- file transfer url
+        """
+
+        if parse.urlparse(url).scheme not in ("http", "https"):
+            with request.urlopen(url, timeout=self._timeout) as response:
+                yield (
+                    response.url,
+                    response.info().get_filename(),
+                    iter(partial(response.read, self.DOWNLOAD_CHUNK_SIZE), b"")
+                )
+            return
+
+        try:
+            response = self._session.get(
+                url, timeout=self._timeout, stream=True
+            )
+        except requests.ConnectTimeout as exc_info:
+            raise request.URLError(exc_info) from exc_info
+        except requests.Timeout as exc_info:
+            raise TimeoutError(str(exc_info)) from exc_info
+        except requests.RequestException as exc_info:
+            raise request.URLError(exc_info) from exc_info
+        with response:
+            try:
+                response.raise_for_status()
+            except requests.HTTPError as exc_info:
+                raise request.HTTPError(
+                    url,
+                    response.status_code,
+                    response.reason,
+                    response.headers,  # type: ignore[arg-type]
+                    None
+                ) from exc_info
+            # only the Content-Disposition-header is parsed (if present);
+            # email.message handles quoting and RFC 2231-encoding
+            filename = None
+            content_disposition = response.headers.get("Content-Disposition")
+            if content_disposition:
+                header = Message()
+                header["Content-Disposition"] = content_disposition
+                filename = header.get_filename()
+            yield (
+                response.url,
+                filename,
+                response.iter_content(self.DOWNLOAD_CHUNK_SIZE)
+            )
 
     def download_file(
         self,
@@ -205,71 +397,81 @@ class PayloadCollector():
         Keyword arguments:
         path -- output path to directory in local filesystem
         url -- file transfer url
-        _filename -- optional filename override
+        _filename -- optional filename override; if the file already
+                     exists, no alternative filename is used
                      (default None)
         """
 
         exc_info = None
         for retry in range(self.max_retries + 1):
             try:
-                with request.urlopen(url, timeout=self._timeout) as response:
+                with self._open_url(url) as (
+                    response_url, filename_from_info, chunks
+                ):
                     filename = _filename
-                    # check for filename provided by header
-                    if filename is None:
-                        filename_from_info = response.info().get_filename()
+                    if filename is not None:
+                        # an explicitly requested filename is not replaced
+                        # by an alternative
+                        attempts = 1
+                    else:
+                        attempts = 10
+                        # check for filename provided by header
                         if filename_from_info is not None:
                             filename = Path(filename_from_info)
-                    # check for filename in url
-                    if filename is None:
-                        filename = Path(
-                            Path(
+                        # check for filename in url (urls always use "/"
+                        # as separator); fall back to a generic name
+                        else:
+                            filename = Path(
                                 parse.unquote(
-                                    parse.urlparse(response.url).path
-                                )
-                            ).name
-                        )
-
-                    # mypy-hint
-                    assert filename is not None
+                                    parse.urlparse(response_url).path
+                                ).rsplit("/", 1)[-1]
+                                or "download.bin"
+                            )
 
-                    # make "sure" nothing is overwritten
-                    for i in range(0, 10):
-                        if i == 9:
-                            msg = (
-                                "Cannot find valid filename for requested "
-                                + f"file with url '{response.url}'."
+                    # make "sure" nothing is overwritten; files are
+                    # created exclusively, alternative names are tried if
+                    # a file already exists
+                    target = path / filename
+                    for i in range(0, attempts):
+                        try:
+                            file = target.open("xb")
+                        except FileExistsError:
+                            target = path / filename.with_name(
+                                filename.stem + f"_{i}" + filename.suffix
                             )
-                            self.log.log(Context.ERROR, body=msg)
-                            raise FileExistsError(msg)
-                        if not (path / filename).is_file():
-                            break
-                        filename.with_name(
-                            filename.stem + f"_{i}" + path.suffix
+                            continue
+                        break
+                    else:
+                        msg = (
+                            "Cannot find valid filename for requested "
+                            + f"file with url '{response_url}'."
                         )
-
-                    # write file
-                    (path / filename).write_bytes(response.read())
-                    return path / filename
-            except request.HTTPError as _exc_info:
-                msg = (
-                    "PayloadCollector encountered an error while requesting "
-                    + f"'{url}' (downloading to '{path}'): {_exc_info}"
-                )
-                self.log.log(Context.ERROR, body=msg)
-                print(msg, file=sys.stderr)
-                exc_info = _exc_info
-                if exc_info.code not in self.retry_on_http_status:
-                    break
-                if retry < self.max_retries:
-                    sleep(self.retry_interval)
+                        self.log.log(Context.ERROR, body=msg)
+                        raise FileExistsError(msg)
+
+                    # write file (streamed in chunks of DOWNLOAD_CHUNK_SIZE
+                    # instead of buffering the entire payload in memory)
+                    try:
+                        with file:
+                            for chunk in chunks:
+                                file.write(chunk)
+                    except BaseException:
+                        # do not leave incomplete files behind
+                        target.unlink(missing_ok=True)
+                        raise
+                    return target
             except request.URLError as _exc_info:
+                # includes request.HTTPError
                 msg = (
                     "PayloadCollector encountered an error while requesting "
-                    + f"'{url}' (downloading to '{path}'): {_exc_info}"
+                    f"'{url}' (downloading to '{path}'): {_exc_info}"
                 )
                 self.log.log(Context.ERROR, body=msg)
                 print(msg, file=sys.stderr)
                 exc_info = _exc_info
+                if isinstance(exc_info, request.HTTPError) \
+                        and exc_info.code not in self.retry_on_http_status:
+                    break
                 if retry < self.max_retries:
                     sleep(self.retry_interval)
         raise exc_info
@@ -304,27 +506,29 @@ class PayloadCollector():
         # list/None in record.files
         if renew_urls or not record.files:
             record.files = []
-            urls = []
-            for idx, transfer_url_filter in enumerate(
-                self._transfer_url_filters
-            ):
-                try:
-                    urls += transfer_url_filter(record.metadata_raw)
-                except SyntaxError as exc_info:
-                    if "not found in prefix map" in str(exc_info):
-                        self.log.log(
-                            Context.ERROR,
-                            body=(
-                                f"Failed to generate url with filter {idx}. "
-                                + "XPath contains unknown namespace: "
-                                + f"{exc_info}."
-                            )
+            # duplicate urls are removed while collecting
+            url_set: set[str] = set()
+            # filters share a single parse of the metadata
+            with _shared_xml_parse():
+                for idx, transfer_url_filter in enumerate(
+                    self._transfer_url_filters
+                ):
+                    try:
+                        url_set.update(
+                            transfer_url_filter(record.metadata_raw)
                         )
-                    else:
-                        raise exc_info
-
-            # remove duplicate urls
-            url_set = set(urls)
+                    except SyntaxError as exc_info:
+                        if "not found in prefix map" in str(exc_info):
+                            self.log.log(
+                                Context.ERROR,
+                                body=(
+                                    "Failed to generate url with filter "
+                                    + f"{idx}. XPath contains unknown "
+                                    + f"namespace: {exc_info}."
+                                )
+                            )
+                        else:
+                            raise exc_info
 
             if len(url_set) > 0:
                 self.log.log(
@@ -360,8 +564,10 @@ class PayloadCollector():
             )
             raise TypeError(msg)
 
-        # iterate files
-        for file in record.files:
+        # download files concurrently
+        def download(file: File) -> None:
+            # mypy - hint
+            assert path is not None
             try:
                 file["path"] = self.download_file(
                     path=path,
@@ -373,3 +579,7 @@ class PayloadCollector():
                     Context.ERROR,
                     body=f"Download failed: {exc_info}."
                 )
+        with ThreadPoolExecutor(
+            max_workers=self._download_workers
+        ) as executor:
+            list(executor.map(download, record.files))
@@ -6,18 +6,66 @@ over on instantiation. Objects of this class are used by the
 ExtractionManager class defined in `extraction_manager.py`.
 """
 
-from typing import Optional
+from typing import Optional, Iterator, Any
 import sys
-from time import sleep
+import re
+import threading
+from time import sleep, monotonic
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from copy import copy
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
 import xmltodict
+from lxml import etree
 from dcm_common import LoggingContext as Context, Logger
 from dcm_common.util import NestedDict, value_from_dict_path
 
 from oai_pmh_extractor.oaipmh_record import OAIPMHRecord
 
 
+# matches the start tag of an OAI-PMH-error (with any namespace prefix)
+_OAI_PMH_ERROR_TAG = re.compile(r"<(?:[\w.-]+:)?error[\s/>]")
+
+
+def _as_list(value: Any) -> list:
+    """
+    Returns value of an xmltodict-element that can occur repeatedly as
+    list (None results in an empty list).
+    """
+
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return value
+    return [value]
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    """
+    Returns delay in seconds requested by the 'Retry-After'-header of
+    response (None if not given or invalid).
+    """
+
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
 class RepositoryInterface():
     """
     Interface for the communication between ExtractionManager and
@@ -30,12 +78,36 @@ class RepositoryInterface():
                (default 10)
     max_retries -- maximum number of retries for fetches
                    (default 1)
-    retry_interval -- interval between retries in seconds
+    retry_interval -- interval between retries in seconds; a longer
+                      delay requested by the server via 'Retry-After'-
+                      header is respected (up to MAX_RETRY_AFTER seconds)
                       (default 1)
     retry_on_http_status -- http status codes for which retries should be made
                             (default None, uses: [429, 503])
+    max_connections -- maximum number of connections that are kept alive
+                       for reuse; should match the number of threads that
+                       use this interface concurrently
+                       (default 10)
+    record_workers -- number of worker threads used by `list_records` to
+                      execute GetRecord-requests concurrently; should not
+                      exceed `max_connections`
+                      (default 1)
+    cache_ttl -- duration in seconds for which responses to `Identify`-,
+                 `ListMetadataFormats`-, and `ListSets`-requests are
+                 cached (up to CACHE_SIZE responses; responses containing
+                 an OAI-PMH-error are not cached); None disables caching
+                 (default None)
+    max_requests_per_second -- upper limit for the rate of requests made
+                               by this interface (across all threads);
+                               None disables the limit
+                               (default None)
     """
 
+    # upper limit in seconds for delays requested via 'Retry-After'
+    MAX_RETRY_AFTER = 60
+    # maximum number of cached responses (see `cache_ttl`)
+    CACHE_SIZE = 128
+
     # define available arguments for selective harvest
     OAI_PMH_ARGUMENTS = {
         "metadata_prefix": "metadataPrefix",
@@ -52,6 +124,10 @@ class RepositoryInterface():
         max_retries: int = 1,
         retry_interval: float = 1.0,
         retry_on_http_status: Optional[list[int]] = None,
+        max_connections: int = 10,
+        record_workers: int = 1,
+        cache_ttl: Optional[float] = None,
+        max_requests_per_second: Optional[float] = None,
     ) -> None:
         self._base_url = base_url
         self._timeout = timeout
@@ -63,30 +139,55 @@ class RepositoryInterface():
             else retry_on_http_status
         )
 
+        # reuse connections across requests
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=max_connections, pool_maxsize=max_connections
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._record_workers = record_workers
+        self._cache_ttl = cache_ttl
+        # maps request url to tuple of expiration time and response
+        # (ordered by expiration time)
+        self._cache: dict[str, tuple[float, str]] = {}
+        self._cache_lock = threading.Lock()
+        # requests are spaced by a minimum interval if rate-limited
+        self._request_interval = (
+            None if max_requests_per_second is None
+            else 1 / max_requests_per_second
+        )
+        self._next_request = 0.0
+        self._rate_limit_lock = threading.Lock()
+
         self.preserve_log = False
         self.log = Logger(default_origin="OAI Repository Interface")
 
+    def log_oneline(self) -> str:
+        """Returns the current log formatted as a single line."""
+        return str(self.log).replace("\n", " ")
+
+    def close(self) -> None:
+        """Close all connections that are kept alive for reuse."""
+
+        self._session.close()
+
     def _build_request(self, **kwargs: str) -> str:
         """
         Build server request as string.
 
         Returns url consisting of the base server url followed by `?`
         and a list of the provided keyword arguments in the format
-        `key=value` separated by ampersands.
+        `key=value` separated by ampersands (values are url-encoded).
         """
 
         if len(kwargs) == 0:
             return self._base_url
 
         # build url base (add character '?' if missing)
-        request_url = self._base_url
-        if self._base_url[-1] != "?":
-            request_url += "?"
-
-        stringified_options = []
-        for option, value in kwargs.items():
-            stringified_options.append(option + "=" + value)
-        return request_url + "&".join(stringified_options)
+        if self._base_url.endswith("?"):
+            return self._base_url + urlencode(kwargs, safe=":/")
+        return self._base_url + "?" + urlencode(kwargs, safe=":/")
 
     def _execute_http_request(self, request_url: str) -> str:
         """
@@ -94,12 +195,24 @@ class RepositoryInterface():
 
         Return response as utf-8-encoded string.
         """
+        return self._execute_http_request_raw(request_url).decode("utf-8")
+
+    def _execute_http_request_raw(self, request_url: str) -> bytes:
+        """
+        Execute http-request for request_url.
+
+        Return response body as bytes (to be passed to lxml without
+        decoding).
+        """
         exc_info = None
         for retry in range(self.max_retries + 1):
             try:
-                response = requests.get(request_url, timeout=self._timeout)
+                self._wait_for_rate_limit()
+                response = self._session.get(
+                    request_url, timeout=self._timeout
+                )
                 response.raise_for_status()
-                return response.content.decode("utf-8")
+                return response.content
             except requests.exceptions.RequestException as _exc_info:
                 msg = (
                     "RepositoryInterface encountered an error while "
@@ -115,12 +228,84 @@ class RepositoryInterface():
                 ):
                     break
                 if retry < self.max_retries:
-                    sleep(self.retry_interval)
+                    delay = self.retry_interval
+                    if _exc_info.response is not None:
+                        retry_after = _retry_after(_exc_info.response)
+                        if retry_after is not None:
+                            delay = max(
+                                delay, min(retry_after, self.MAX_RETRY_AFTER)
+                            )
+                    sleep(delay)
         raise exc_info
 
-    def _check_for_oaipmh_errors(self, response: NestedDict) -> bool:
+    def _wait_for_rate_limit(self) -> None:
+        """
+        Block until the next request is allowed to be made (see
+        `max_requests_per_second`).
+        """
+
+        if self._request_interval is None:
+            return
+        with self._rate_limit_lock:
+            now = monotonic()
+            scheduled = max(now, self._next_request)
+            self._next_request = scheduled + self._request_interval
+        if scheduled > now:
+            sleep(scheduled - now)
+
+    def _execute_cached_http_request(self, request_url: str) -> str:
+        """
+        Execute http-request for request_url or, if available, use
+        cached response (see `cache_ttl`).
+
+        Return response as utf-8-encoded string.
+        """
+
+        if self._cache_ttl is None:
+            return self._execute_http_request(request_url)
+
+        with self._cache_lock:
+            self._evict_expired_responses()
+            cached = self._cache.get(request_url)
+        if cached is not None:
+            return cached[1]
+        response = self._execute_http_request(request_url)
+        # OAI-PMH-errors are returned with status 200
+        if _OAI_PMH_ERROR_TAG.search(response) is not None:
+            return response
+        with self._cache_lock:
+            # (re-)insert as latest entry
+            self._cache.pop(request_url, None)
+            if len(self._cache) >= self.CACHE_SIZE:
+                del self._cache[next(iter(self._cache))]
+            self._cache[request_url] = (
+                monotonic() + self._cache_ttl, response
+            )
+        return response
+
+    def _evict_expired_responses(self) -> None:
+        """
+        Remove expired responses from cache (requires `_cache_lock`).
+        """
+
+        now = monotonic()
+        while self._cache:
+            request_url, (expiration, _) = next(iter(self._cache.items()))
+            if expiration > now:
+                break
+            del self._cache[request_url]
+
+    def clear_cache(self) -> None:
+        """Clear cached responses (see `cache_ttl`)."""
+
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _check_for_oaipmh_errors(
+        self, response: NestedDict, log: Optional[Logger] = None
+    ) -> bool:
         if value_from_dict_path(response, ["OAI-PMH", "error"]) is not None:
-            self.log.log(
+            (self.log if log is None else log).log(
                 Context.ERROR,
                 body=response["OAI-PMH"]["error"]["@code"] + ": " +
                     response["OAI-PMH"]["error"]["#text"]
@@ -128,6 +313,57 @@ class RepositoryInterface():
             return True
         return False
 
+    def _log_oaipmh_error(self, error: etree._Element) -> None:
+        self.log.log(
+            Context.ERROR,
+            body=error.get("code", "") + ": " + (error.text or "")
+        )
+
+    def _check_for_oaipmh_errors_in_tree(self, root: etree._Element) -> bool:
+        error = root.find("{*}error")
+        if error is not None:
+            self._log_oaipmh_error(error)
+            return True
+        return False
+
+    @classmethod
+    def _build_list_options(
+        cls,
+        verb: str,
+        _metadata_prefix: Optional[str] = None,
+        _from: Optional[str] = None,
+        _until: Optional[str] = None,
+        _set_spec: Optional[str] = None,
+        _resumption_token: Optional[str] = None
+    ) -> dict[str, str]:
+        """
+        Build options-dict for a selective harvest-request (`verb`).
+
+        The resumption token is an exclusive argument, i.e. if given,
+        all other arguments are ignored.
+        """
+
+        if _resumption_token is not None:
+            # ignore all arguments but _resumption_token
+            return {
+                cls.OAI_PMH_ARGUMENTS["resumption_token"]: _resumption_token
+            }
+        if _metadata_prefix is None:
+            raise ValueError(
+                f"Missing _metadata_prefix for {verb}-request."
+            )
+        arguments = cls.OAI_PMH_ARGUMENTS
+        return {
+            arguments[option]: value
+            for option, value in (
+                ("metadata_prefix", _metadata_prefix),
+                ("from", _from),
+                ("until", _until),
+                ("set", _set_spec),
+            )
+            if value is not None
+        }
+
     def identify(self) -> NestedDict:
         """
         Issue repository server with `Identify`-request.
@@ -137,7 +373,7 @@ class RepositoryInterface():
 
         # no error expected here (according to OAI-PMH specification)
 
-        response = self._execute_http_request(
+        response = self._execute_cached_http_request(
             self._build_request(verb="Identify")
         )
         return xmltodict.parse(response)
@@ -154,7 +390,7 @@ class RepositoryInterface():
             self.log = Logger(default_origin="OAI Repository Interface")
 
         # make request
-        response = self._execute_http_request(
+        response = self._execute_cached_http_request(
             self._build_request(verb="ListMetadataFormats")
         )
 
@@ -166,18 +402,12 @@ class RepositoryInterface():
             return []
 
         # continue to process response
-        list_of_formats = \
+        return _as_list(
             value_from_dict_path(
                 response_dict,
                 ["OAI-PMH", "ListMetadataFormats", "metadataFormat"]
             )
-
-        # secure response type
-        if list_of_formats is None:
-            list_of_formats = []
-        if not isinstance(list_of_formats, list):
-            list_of_formats = [list_of_formats]
-        return list_of_formats
+        )
 
     def list_metadata_prefixes(self) -> list[str]:
         """
@@ -186,14 +416,32 @@ class RepositoryInterface():
         Returns a list of metadata prefixes as strings.
         """
 
+        # clear log
+        if not self.preserve_log:
+            self.log = Logger(default_origin="OAI Repository Interface")
+
         # make request
-        list_of_formats = self.list_metadata_formats()
+        response = self._execute_cached_http_request(
+            self._build_request(verb="ListMetadataFormats")
+        )
 
-        # process response
-        list_of_prefixes = []
-        for metadata_format in list_of_formats:
-            list_of_prefixes.append(metadata_format["metadataPrefix"])
-        return list_of_prefixes
+        # process response (only the prefixes are extracted; the response
+        # has already been decoded, so any declared encoding needs to be
+        # overridden)
+        root = etree.fromstring(
+            response.encode("utf-8"), etree.XMLParser(encoding="utf-8")
+        )
+
+        # check and handle possible errors
+        if self._check_for_oaipmh_errors_in_tree(root):
+            return []
+
+        return [
+            (element.text or "").strip()
+            for element in root.iterfind(
+                "{*}ListMetadataFormats/{*}metadataFormat/{*}metadataPrefix"
+            )
+        ]
 
     def list_identifiers_exhaustive_multiple_sets(
         self,
@@ -224,26 +472,29 @@ class RepositoryInterface():
                                   (default None leads to no restriction)
         """
 
-        identifiers = []
-        if _set_spec is not None:
-            for _set in _set_spec:
-                identifiers_ = self.list_identifiers_exhaustive(
+        # a single set (or none) requires no deduplication
+        if _set_spec is None or len(_set_spec) == 1:
+            return self.list_identifiers_exhaustive(
+                metadata_prefix=metadata_prefix,
+                _from=_from,
+                _until=_until,
+                _set_spec=None if _set_spec is None else _set_spec[0],
+                _max_resumption_tokens=_max_resumption_tokens,
+            )
+
+        # identifiers of records in multiple sets are only listed once
+        identifiers: set[str] = set()
+        for _set in _set_spec:
+            identifiers.update(
+                self.list_identifiers_exhaustive(
                     metadata_prefix=metadata_prefix,
                     _from=_from,
                     _until=_until,
                     _set_spec=_set,
                     _max_resumption_tokens=_max_resumption_tokens,
                 )
-                identifiers.extend(identifiers_)
-
-            return list(set(identifiers))
-        return self.list_identifiers_exhaustive(
-            metadata_prefix=metadata_prefix,
-            _from=_from,
-            _until=_until,
-            _set_spec=_set_spec,
-            _max_resumption_tokens=_max_resumption_tokens,
-        )
+            )
+        return list(identifiers)
 
     def list_identifiers_exhaustive(
         self,
@@ -299,6 +550,47 @@ class RepositoryInterface():
 
         return identifiers
 
+    def iter_identifiers(
+        self,
+        metadata_prefix: str,
+        _from: Optional[str] = None,
+        _until: Optional[str] = None,
+        _set_spec: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Issue repository server with repeated `ListIdentifiers`-requests
+        until no resumption token is returned.
+
+        Returns a generator of identifiers as strings. Requests are only
+        made once the identifiers of the previous page have been
+        consumed. The iteration stops if an error occurs (see log).
+
+        Keyword arguments:
+        metadata_prefix -- required argument for oai-pmh; only identifiers
+                           are listed that can satisfy the given format
+        _from -- lower datestamp in daterange for selective harvest
+                 (default None)
+        _until -- upper datestamp in daterange for selective harvest
+                  (default None)
+        _set_spec -- colon-separated list of path in set hierarchy
+                     (default None)
+        """
+
+        token = None
+        while True:  # iterate until no resumption token is given
+            identifiers, next_token = self.list_identifiers(
+                _metadata_prefix=metadata_prefix,
+                _from=_from,
+                _until=_until,
+                _set_spec=_set_spec,
+                _resumption_token=token
+            )
+            yield from identifiers
+            # an error is indicated by an empty page and unchanged token
+            if next_token is None or (not identifiers and next_token == token):
+                break
+            token = next_token
+
     def list_identifiers(
         self,
         _metadata_prefix: Optional[str] = None,
@@ -328,66 +620,91 @@ class RepositoryInterface():
                              (default None)
         """
 
+        headers, resumption_token = self.list_headers(
+            _metadata_prefix=_metadata_prefix,
+            _from=_from,
+            _until=_until,
+            _set_spec=_set_spec,
+            _resumption_token=_resumption_token
+        )
+        return [identifier for identifier, _ in headers], resumption_token
+
+    def list_headers(
+        self,
+        _metadata_prefix: Optional[str] = None,
+        _from: Optional[str] = None,
+        _until: Optional[str] = None,
+        _set_spec: Optional[str] = None,
+        _resumption_token: Optional[str] = None
+    ) -> tuple[list[tuple[str, Optional[str]]], Optional[str]]:
+        """
+        Issue repository server with `ListIdentifiers`-request.
+
+        Returns a list of record headers as tuples of identifier and
+        datestamp (None if not given) and resumption token as tuple.
+
+        Keyword arguments:
+        _metadata_prefix -- required argument for oai-pmh; only identifiers
+                            are listed that can satisfy the given format
+                            (default None)
+        _from -- lower datestamp in daterange for selective harvest
+                 (default None)
+        _until -- upper datestamp in daterange for selective harvest
+                  (default None)
+        _set_spec -- colon-separated list of path in set hierarchy
+                     (default None)
+        _resumption_token -- resumption token for follow up of previous
+                             request
+                             (default None)
+        """
+
         # clear log
         if not self.preserve_log and _resumption_token is None:
             self.log = Logger(default_origin="OAI Repository Interface")
 
         # build options-dict
-        options = {}
-        # resumption token is an exclusive argument
-        if _resumption_token is not None:
-            # ignore all arguments but _resumption_token
-            options[self.OAI_PMH_ARGUMENTS["resumption_token"]] = \
-                _resumption_token
-        else:
-            if _metadata_prefix is None:
-                raise ValueError(
-                    "Missing _metadata_prefix for ListIdentifiers-request."
-                )
-            options[self.OAI_PMH_ARGUMENTS["metadata_prefix"]] = \
-                _metadata_prefix
-            for option in [
-                (self.OAI_PMH_ARGUMENTS["from"], _from),
-                (self.OAI_PMH_ARGUMENTS["until"], _until),
-                (self.OAI_PMH_ARGUMENTS["set"], _set_spec)
-            ]:
-                if option[1] is not None:
-                    options[option[0]] = option[1]
+        options = self._build_list_options(
+            "ListIdentifiers",
+            _metadata_prefix=_metadata_prefix,
+            _from=_from,
+            _until=_until,
+            _set_spec=_set_spec,
+            _resumption_token=_resumption_token
+        )
 
         # make request
-        response = self._execute_http_request(
+        response = self._execute_http_request_raw(
             self._build_request(verb="ListIdentifiers", **options)
         )
 
-        # process result
-        response_dict = \
-            xmltodict.parse(response)
-
-        # check and handle possible errors
-        if self._check_for_oaipmh_errors(response_dict):
-            return [], _resumption_token
-
-        # make list of identifiers and get token
-        list_of_identifiers = []
+        # process result; the response is parsed incrementally and
+        # processed elements are discarded right away
+        list_of_headers = []
         resumption_token = None
-        if "ListIdentifiers" in response_dict["OAI-PMH"]:
-            if "header" in response_dict["OAI-PMH"]["ListIdentifiers"]:
-                if isinstance(response_dict["OAI-PMH"]["ListIdentifiers"]["header"], list):
-                    for header in response_dict["OAI-PMH"]["ListIdentifiers"]["header"]:
-                        list_of_identifiers.append(header["identifier"])
-                else:
-                    list_of_identifiers.append(
-                        response_dict["OAI-PMH"]["ListIdentifiers"]["header"]["identifier"]
+        for _, element in etree.iterparse(
+            BytesIO(response),
+            events=("end",),
+            tag=("{*}error", "{*}header", "{*}resumptionToken"),
+        ):
+            tag = etree.QName(element).localname
+            # check and handle possible errors
+            if tag == "error":
+                self._log_oaipmh_error(element)
+                return [], _resumption_token
+            if tag == "header":
+                list_of_headers.append(
+                    (
+                        (element.findtext("{*}identifier") or "").strip(),
+                        (element.findtext("{*}datestamp") or "").strip()
+                        or None,
                     )
-            if "resumptionToken" in response_dict["OAI-PMH"]["ListIdentifiers"]:
-                if isinstance(response_dict["OAI-PMH"]["ListIdentifiers"]["resumptionToken"], dict):
-                    if "#text" in response_dict["OAI-PMH"]["ListIdentifiers"]["resumptionToken"]:
-                        resumption_token = \
-                            response_dict["OAI-PMH"]["ListIdentifiers"]["resumptionToken"]["#text"]
-                else:
-                    resumption_token = \
-                        response_dict["OAI-PMH"]["ListIdentifiers"]["resumptionToken"]
-        return list_of_identifiers, resumption_token
+                )
+            else:
+                resumption_token = (element.text or "").strip() or None
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+        return list_of_headers, resumption_token
 
     def list_sets(self, _resumption_token: Optional[str] = None) \
             -> tuple[list[NestedDict], Optional[str]]:
@@ -415,7 +732,7 @@ class RepositoryInterface():
             options[self.OAI_PMH_ARGUMENTS["resumption_token"]] = _resumption_token
 
         # make request
-        response = self._execute_http_request(
+        response = self._execute_cached_http_request(
             self._build_request(verb="ListSets", **options)
         )
 
@@ -428,11 +745,9 @@ class RepositoryInterface():
             return [], _resumption_token
 
         # continue processing response
-        list_of_sets = value_from_dict_path(response_dict, ["OAI-PMH", "ListSets", "set"])
-        if list_of_sets is None:
-            list_of_sets = []
-        elif not isinstance(list_of_sets, list):
-            list_of_sets = [list_of_sets]
+        list_of_sets = _as_list(
+            value_from_dict_path(response_dict, ["OAI-PMH", "ListSets", "set"])
+        )
         resumption_token = value_from_dict_path(
             response_dict, ["OAI-PMH", "ListSets", "resumptionToken", "#text"]
         ) or value_from_dict_path(
@@ -441,8 +756,12 @@ class RepositoryInterface():
 
         return list_of_sets, resumption_token
 
-    def get_record(self, metadata_prefix: str, identifier: str) \
-            -> Optional[OAIPMHRecord]:
+    def get_record(
+        self,
+        metadata_prefix: str,
+        identifier: str,
+        _log: Optional[Logger] = None
+    ) -> Optional[OAIPMHRecord]:
         """
         Issue repository server with `GetRecord`-request.
 
@@ -452,11 +771,17 @@ class RepositoryInterface():
         Keyword arguments:
         metadata_prefix -- specify metadata-format ("oai_dc", ..)
         identifier -- repository record identifier string
+        _log -- Logger for messages regarding the response; if given,
+                the log of the interface is neither cleared nor used for
+                these messages (intended for concurrent requests)
+                (default None)
         """
 
         # clear log
-        if not self.preserve_log:
-            self.log = Logger(default_origin="OAI Repository Interface")
+        if _log is None:
+            if not self.preserve_log:
+                self.log = Logger(default_origin="OAI Repository Interface")
+            _log = self.log
 
         # make request
         response = self._execute_http_request(
@@ -467,19 +792,23 @@ class RepositoryInterface():
             )
         )
 
+        # process response (parsed once for error-check and record)
+        response_dict = xmltodict.parse(response)
+
         # check and handle possible errors
-        if self._check_for_oaipmh_errors(xmltodict.parse(response)):
+        if self._check_for_oaipmh_errors(response_dict, _log):
             return None
 
-        # process response
-        response_dict = \
-            xmltodict.parse(response)["OAI-PMH"]["GetRecord"]["record"]
+        response_dict = response_dict["OAI-PMH"]["GetRecord"]["record"]
 
         status = ""
+        datestamp = None
+        if "header" in response_dict:
+            datestamp = response_dict["header"].get("datestamp")
         if "header" in response_dict \
                 and "@status" in response_dict["header"]:
             status = response_dict["header"]["@status"]
-            self.log.log(
+            _log.log(
                 Context.WARNING,
                 body=f"Record {identifier} has status {status}."
             )
@@ -488,13 +817,14 @@ class RepositoryInterface():
             status=status,
             metadata_prefix=metadata_prefix,
             metadata_raw=response,
+            datestamp=datestamp,
         )
 
     # list_records is implemented using a combination of `ListIdentifiers`-
-    # and `GetRecord`-requests. Note that the harvest is not a time-critical
-    # operation. A use of the `ListRecords`-verb furthermore complicates the
-    # separation of individual source-metadata records as those are returned
-    # in a single string which then requires additional processing.
+    # and `GetRecord`-requests. This requires one request per record but
+    # yields the original `GetRecord`-response as source metadata. See
+    # list_records_bulk for an implementation based on the
+    # `ListRecords`-verb.
     def list_records(
         self,
         metadata_prefix: str,
@@ -541,20 +871,178 @@ class RepositoryInterface():
             _resumption_token=_resumption_token
         )
 
-        # make list of OAIPMHRecords
+        # make list of OAIPMHRecords (requests are executed concurrently,
+        # results are collected in order)
         list_of_records = []
-        for identifier in list_of_identifiers:
-            record = self.get_record(
-                metadata_prefix=metadata_prefix,
-                identifier=identifier
+        with ThreadPoolExecutor(max_workers=self._record_workers) as executor:
+            futures = [
+                executor.submit(
+                    self.get_record,
+                    metadata_prefix=metadata_prefix,
+                    identifier=identifier,
+                    _log=self.log
+                )
+                for identifier in list_of_identifiers
+            ]
+            try:
+                for future in futures:
+                    record = future.result()
+                    # handle error (failing single record means the request
+                    # cannot be fulfilled)
+                    if record is None:
+                        return [], _resumption_token
+
+                    list_of_records.append(
+                        record
+                    )
+            finally:
+                # skip pending requests if aborted
+                for future in futures:
+                    future.cancel()
+
+        return list_of_records, resumption_token
+
+    def list_records_bulk(
+        self,
+        metadata_prefix: Optional[str] = None,
+        _from: Optional[str] = None,
+        _until: Optional[str] = None,
+        _set_spec: Optional[str] = None,
+        _resumption_token: Optional[str] = None,
+    ) -> tuple[list[OAIPMHRecord], Optional[str]]:
+        """
+        Issue repository server with `ListRecords`-request.
+
+        Returns list of OAIPMHRecord-objects corresponding to records
+        and resumption token as tuple.
+
+        Compared to `list_records`, a single request per page of records
+        is made. In order to keep the records compatible with those
+        generated by `get_record`, the source metadata of each record is
+        formatted like the response to a `GetRecord`-request.
+
+        Keyword arguments:
+        metadata_prefix -- required argument for oai-pmh (unless a
+                           resumption token is given); only records
+                           are listed that can satisfy the given format
+                           (default None)
+        _from -- lower datestamp in daterange for selective harvest
+                 (default None)
+        _until -- upper datestamp in daterange for selective harvest
+                  (default None)
+        _set_spec -- colon-separated list of path in set hierarchy
+                     (default None)
+        _resumption_token -- resumption token for follow up of previous
+                             request
+                             (default None)
+        """
+
+        # clear log
+        if not self.preserve_log and _resumption_token is None:
+            self.log = Logger(default_origin="OAI Repository Interface")
+
+        # make request
+        response = self._execute_http_request_raw(
+            self._build_request(
+                verb="ListRecords",
+                **self._build_list_options(
+                    "ListRecords",
+                    _metadata_prefix=metadata_prefix,
+                    _from=_from,
+                    _until=_until,
+                    _set_spec=_set_spec,
+                    _resumption_token=_resumption_token
+                )
             )
-            # handle error (failing single record means the request
-            # cannot be fulfilled)
-            if record is None:
-                return [], _resumption_token
+        )
+
+        # process response; the response is parsed incrementally and
+        # records are moved out of the document once complete
+        root = None
+        response_date = None
+        list_of_records = []
+        resumption_token = None
+        for event, element in etree.iterparse(
+            BytesIO(response),
+            events=("start", "end"),
+            tag=(
+                "{*}OAI-PMH", "{*}responseDate", "{*}error", "{*}record",
+                "{*}resumptionToken"
+            ),
+        ):
+            if event == "start":
+                if root is None:
+                    root = element
+                continue
+            # mypy-hint
+            assert root is not None
+            parent = element.getparent()
+            tag = etree.QName(element).localname
+            # skip nested elements of the same name (e.g. in metadata)
+            if parent is None:
+                continue
+            if parent is root:
+                # check and handle possible errors
+                if tag == "error":
+                    self._log_oaipmh_error(element)
+                    return [], _resumption_token
+                if tag == "responseDate":
+                    response_date = copy(element)
+                continue
+            if parent.getparent() is not root \
+                    or etree.QName(parent).localname != "ListRecords":
+                continue
+            if tag == "resumptionToken":
+                resumption_token = (element.text or "").strip() or None
+                continue
+            if tag != "record":
+                continue
+
+            record = element
+            header = record.find("{*}header")
+            identifier = (
+                "" if header is None
+                else (header.findtext("{*}identifier") or "").strip()
+            )
+            status = "" if header is None else header.get("status", "")
+            datestamp = (
+                None if header is None
+                else (header.findtext("{*}datestamp") or "").strip() or None
+            )
+            if status != "":
+                self.log.log(
+                    Context.WARNING,
+                    body=f"Record {identifier} has status {status}."
+                )
+
+            # build GetRecord-response from record
+            namespace = etree.QName(root).namespace
+            envelope = etree.Element(
+                root.tag, attrib=dict(root.attrib), nsmap=root.nsmap
+            )
+            if response_date is not None:
+                envelope.append(copy(response_date))
+            etree.SubElement(
+                envelope,
+                etree.QName(namespace, "request"),
+                verb="GetRecord",
+                identifier=identifier,
+                metadataPrefix=(
+                    metadata_prefix if metadata_prefix is not None else ""
+                ),
+            ).text = self._base_url
+            etree.SubElement(
+                envelope, etree.QName(namespace, "GetRecord")
+            ).append(record)
 
             list_of_records.append(
-                record
+                OAIPMHRecord(
+                    identifier=identifier,
+                    status=status,
+                    metadata_prefix=metadata_prefix,
+                    metadata_raw=etree.tostring(envelope, encoding="unicode"),
+                    datestamp=datestamp,
+                )
             )
 
         return list_of_records, resumption_token
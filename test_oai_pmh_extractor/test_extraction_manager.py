@@ -3,8 +3,8 @@
 import os
 import sys
 import io
+import json
 import time
-import threading
 import shutil
 from urllib import request
 from unittest import mock
@@ -12,6 +12,7 @@ from unittest import mock
 from pathlib import Path
 import pytest
 import requests
+from dcm_common import LoggingContext as Context
 
 from oai_pmh_extractor \
     import ExtractionManager, RepositoryInterface, OAIPMHRecord
@@ -44,7 +45,7 @@ def test_harvest_latency(simple_manager):
     def faked_list_identifiers(**kwargs):
         time.sleep(response_identifiers_delay)
         return (response_identifiers, response_token)
-    def faked_get_record(metadata_prefix, identifier):
+    def faked_get_record(metadata_prefix, identifier, _log=None):
         time.sleep(response_records_delay)
         return OAIPMHRecord(identifier)
 
@@ -63,20 +64,15 @@ def test_harvest_latency(simple_manager):
         # start harvest-job
         jobid = simple_manager.harvest(
             "oai_dc",
-            _progress_callback=lambda job: print(len(job.records), end="\r")
+            _progress_callback=lambda job: print(len(job.records), end="\r"),
+            _use_list_records=False
         )
 
         # wait for job to terminate
         job = simple_manager.get_job(jobid)
         max_duration = 2 * (response_identifiers_delay \
             + response_records_delay * len(response_identifiers))
-        i = 0
-        while not job.complete:
-            time.sleep(0.01)
-            print(".", end="", flush=True)
-            i += 1
-            if i > max_duration/0.01:
-                break
+        assert job.wait(timeout=max_duration)
 
         # make assertions
         assert len(job.records) == len(response_identifiers)
@@ -92,6 +88,117 @@ def test_harvest_latency(simple_manager):
         print("")
         # print(simple_manager.log)
 
+def test_harvest_list_records(simple_manager):
+    """
+    Test for harvest-method in ExtractionManager using ListRecords.
+    """
+
+    response_pages = {
+        None: (["id0", "id1"], "token0"),
+        "token0": (["id2"], None),
+    }
+
+    def faked_list_records_bulk(_resumption_token=None, **kwargs):
+        identifiers, token = response_pages[_resumption_token]
+        return (
+            [
+                OAIPMHRecord(
+                    identifier, metadata_prefix="oai_dc", metadata_raw="<a/>"
+                )
+                for identifier in identifiers
+            ],
+            token
+        )
+
+    with mock.patch.object(
+        simple_manager._repository_interface,
+        "list_records_bulk",
+        side_effect=faked_list_records_bulk
+    ), mock.patch.object(
+        simple_manager._repository_interface,
+        "log_oneline",
+        side_effect=lambda: ""
+    ):
+        jobid = simple_manager.harvest(
+            "oai_dc",
+            _filter=lambda record: record.identifier != "id1"
+        )
+
+        # wait for job to terminate
+        job = simple_manager.get_job(jobid)
+        max_duration = 0.5
+        assert job.wait(timeout=max_duration)
+
+        # make assertions
+        assert job.complete
+        assert [record.identifier for record in job.records] == ["id0", "id2"]
+        assert [record.identifier for record in job.omitted_records] == ["id1"]
+        for record in job.records:
+            assert record.complete
+            assert record.metadata_raw == "<a/>"
+
+        assert simple_manager._repository_interface.list_records_bulk.call_count == 2
+        simple_manager._repository_interface.list_identifiers.assert_not_called()
+        simple_manager._repository_interface.get_record.assert_not_called()
+
+@pytest.mark.parametrize(
+    "use_list_records",
+    [True, False],
+    ids=["ListRecords", "ListIdentifiers"]
+)
+def test_harvest_known(simple_manager, use_list_records):
+    """
+    Test for harvest-method in ExtractionManager with _known-argument.
+    """
+
+    response_headers = [("id0", "2024-01-01"), ("id1", "2024-02-01")]
+
+    def faked_list_records_bulk(**kwargs):
+        return (
+            [
+                OAIPMHRecord(identifier, datestamp=datestamp)
+                for identifier, datestamp in response_headers
+            ],
+            None
+        )
+    def faked_get_record(metadata_prefix, identifier, _log=None):
+        return OAIPMHRecord(
+            identifier, datestamp=dict(response_headers)[identifier]
+        )
+
+    with mock.patch.object(
+        simple_manager._repository_interface,
+        "list_records_bulk",
+        side_effect=faked_list_records_bulk
+    ), mock.patch.object(
+        simple_manager._repository_interface,
+        "list_headers",
+        side_effect=lambda **kwargs: (response_headers, None)
+    ), mock.patch.object(
+        simple_manager._repository_interface,
+        "get_record",
+        side_effect=faked_get_record
+    ), mock.patch.object(
+        simple_manager._repository_interface,
+        "log_oneline",
+        side_effect=lambda: ""
+    ):
+        jobid = simple_manager.harvest(
+            "oai_dc",
+            _use_list_records=use_list_records,
+            _known={"id0": "2024-01-01", "id1": "2023-12-01"}
+        )
+        simple_manager.close()
+
+        # make assertions
+        job = simple_manager.get_job(jobid)
+        assert job.complete
+        assert [record.identifier for record in job.records] == ["id1"]
+        assert job.records[0].datestamp == "2024-02-01"
+        if not use_list_records:
+            simple_manager._repository_interface.list_identifiers.assert_not_called()
+            simple_manager._repository_interface.get_record.assert_called_once()
+
 def test_harvest_identifiers(simple_manager):
     """
     Test for harvest-method in ExtractionManager.
@@ -102,7 +209,7 @@ def test_harvest_identifiers(simple_manager):
     requested_identifiers = ["id0", "id1"]
 
     # fake requests taking time to execute via side-effect
-    def faked_get_record(metadata_prefix, identifier):
+    def faked_get_record(metadata_prefix, identifier, _log=None):
         return OAIPMHRecord(identifier)
 
     with mock.patch.object(
@@ -122,12 +229,7 @@ def test_harvest_identifiers(simple_manager):
         # wait for job to terminate
         job = simple_manager.get_job(jobid)
         max_duration = 0.5
-        i = 0
-        while not job.complete:
-            time.sleep(0.01)
-            i += 1
-            if i > max_duration/0.01:
-                break
+        assert job.wait(timeout=max_duration)
 
         # make assertions
         assert len(job.records) == len(requested_identifiers)
@@ -152,7 +254,7 @@ def test_harvest_identifiers_with_error(simple_manager):
     failing_identifier = requested_identifiers[0]
 
     # fake requests taking time to execute via side-effect
-    def faked_get_record(metadata_prefix, identifier):
+    def faked_get_record(metadata_prefix, identifier, _log=None):
         if identifier == failing_identifier:
             return None
         return OAIPMHRecord(identifier)
@@ -172,12 +274,7 @@ def test_harvest_identifiers_with_error(simple_manager):
         # wait for job to terminate
         job = simple_manager.get_job(jobid)
         max_duration = 0.5
-        i = 0
-        while not job.complete:
-            time.sleep(0.01)
-            i += 1
-            if i > max_duration/0.01:
-                break
+        assert job.wait(timeout=max_duration)
 
         # make assertions
         assert len(job.records) == len(requested_identifiers)
@@ -189,6 +286,98 @@ def test_harvest_identifiers_with_error(simple_manager):
             else:
                 assert record.complete
 
+def test_harvest_progress_interval(simple_manager):
+    """
+    Test for harvest-method in ExtractionManager with a throttled
+    _progress_callback.
+    """
+
+    requested_identifiers = ["id0", "id1", "id2", "id3"]
+    progress_callback = mock.MagicMock()
+
+    with mock.patch.object(
+        simple_manager._repository_interface,
+        "get_record",
+        side_effect=lambda metadata_prefix, identifier, _log=None: OAIPMHRecord(identifier)
+    ):
+        jobid = simple_manager.harvest(
+            "oai_dc",
+            _identifiers=requested_identifiers,
+            _progress_callback=progress_callback,
+            _progress_interval=10
+        )
+
+        # wait for job to terminate
+        simple_manager.close()
+        job = simple_manager.get_job(jobid)
+
+        # only first call, end of harvest, and completion are reported
+        assert job.complete
+        assert progress_callback.call_count == 3
+
+def test_harvest_state(simple_manager, tmp_path):
+    """
+    Test for harvest-method in ExtractionManager resuming a harvest via
+    a state-file.
+    """
+
+    requested_identifiers = ["id0", "id1", "id2"]
+    state_path = tmp_path / "state.json"
+    state_path.write_text(json.dumps({"processed": ["id0"]}), encoding="utf-8")
+
+    with mock.patch.object(
+        simple_manager._repository_interface,
+        "get_record",
+        side_effect=lambda metadata_prefix, identifier, _log=None: OAIPMHRecord(identifier)
+    ):
+        # abort job after harvest to keep the state-file
+        jobid = simple_manager.harvest(
+            "oai_dc",
+            _identifiers=requested_identifiers,
+            _final_callback=lambda job, event: event.set(),
+            _state_path=state_path
+        )
+
+        # wait for job to terminate
+        simple_manager.close()
+        job = simple_manager.get_job(jobid)
+
+        assert not job.complete
+        assert [record.identifier for record in job.records] == ["id1", "id2"]
+        assert simple_manager._repository_interface.get_record.call_count == 2
+        assert sorted(
+            json.loads(state_path.read_text(encoding="utf-8"))["processed"]
+        ) == requested_identifiers
+
+def test_harvest_state_complete(fake_interface, tmp_path):
+    """
+    Test for harvest-method in ExtractionManager removing the state-file
+    once the job has completed.
+    """
+
+    requested_identifiers = ["id0", "id1"]
+    state_path = tmp_path / "state.json"
+
+    with mock.patch.object(
+        fake_interface,
+        "get_record",
+        side_effect=lambda metadata_prefix, identifier, _log=None: OAIPMHRecord(identifier)
+    ):
+        for _ in range(2):
+            manager = ExtractionManager(fake_interface)
+            jobid = manager.harvest(
+                "oai_dc",
+                _identifiers=requested_identifiers,
+                _state_path=state_path
+            )
+            manager.close()
+            job = manager.get_job(jobid)
+
+            # repeated harvest is not affected by previous one
+            assert job.complete
+            assert len(job.records) == len(requested_identifiers)
+            assert not state_path.exists()
+
 def test_harvest_abort(simple_manager):
     """
     Test for aborting harvest-method in ExtractionManager.
@@ -205,7 +394,7 @@ def test_harvest_abort(simple_manager):
     def faked_list_identifiers(**kwargs):
         time.sleep(response_identifiers_delay)
         return (response_identifiers, response_token)
-    def faked_get_record(metadata_prefix, identifier):
+    def faked_get_record(metadata_prefix, identifier, _log=None):
         time.sleep(response_records_delay)
         return OAIPMHRecord(identifier)
 
@@ -220,30 +409,31 @@ def test_harvest_abort(simple_manager):
     ):
         # start harvest-job
         jobid = simple_manager.harvest(
-            "oai_dc"
+            "oai_dc",
+            _use_list_records=False
         )
 
         time.sleep(0.25 * response_identifiers_delay)
 
-        # check if thread has started
-        assert len(threading.enumerate()) == 2
-
-        # get reference to thread and abort
+        # get reference to thread and check if it has started
         thread = simple_manager._running_threads[jobid][0]
+        assert thread.running()
+
+        # abort
         simple_manager.abort_job(jobid)
 
         # wait for job to terminate
         max_duration = 2 * (response_identifiers_delay \
             + response_records_delay * len(response_identifiers))
         i = 0
-        while thread.is_alive():
+        while not thread.done():
             time.sleep(0.01)
             i += 1
             if i > max_duration/0.01:
                 break
 
         # thread is not running any more
-        assert len(threading.enumerate()) == 1
+        assert thread.done()
         # not listed in active threads
         assert len(simple_manager._running_threads) == 0
         # job has not been completed
@@ -253,6 +443,198 @@ def test_harvest_abort(simple_manager):
         # print(simple_manager.get_job(jobid).log)
         # print(simple_manager.log)
 
+def test_harvest_concurrent_get_record(fake_interface):
+    """
+    Test for concurrent execution of GetRecord-requests in harvest-method
+    of ExtractionManager.
+    """
+
+    response_identifiers = ["id0", "id1", "id2", "id3"]
+    response_records_delay = 0.1
+
+    # fake requests taking time to execute via side-effect
+    def faked_get_record(metadata_prefix, identifier, _log=None):
+        time.sleep(response_records_delay)
+        return OAIPMHRecord(identifier)
+
+    manager = ExtractionManager(
+        fake_interface, harvest_workers=len(response_identifiers)
+    )
+    with mock.patch.object(
+        manager._repository_interface,
+        "get_record",
+        side_effect=faked_get_record
+    ):
+        jobid = manager.harvest(
+            "oai_dc",
+            _identifiers=response_identifiers
+        )
+
+        # wait for job to terminate
+        job = manager.get_job(jobid)
+        max_duration = response_records_delay * len(response_identifiers)
+        start = time.monotonic()
+        assert job.wait(timeout=max_duration)
+
+        # requests have been made concurrently
+        assert time.monotonic() - start < 0.5 * max_duration
+        assert job.complete
+        for record in job.records:
+            assert record.complete
+        assert manager._repository_interface.get_record.call_count == \
+            len(response_identifiers)
+
+def test_harvest_concurrent_get_record_errors():
+    """
+    Test for harvest-method in ExtractionManager logging OAI-PMH-errors
+    of concurrent GetRecord-requests for the correct record.
+    """
+
+    error_codes = {"id0": "idDoesNotExist", "id1": "cannotDisseminateFormat"}
+
+    # fake responses; the first request finishes last
+    def faked_execute_http_request(request_url):
+        identifier = request_url.rsplit("identifier=", 1)[-1]
+        time.sleep(0.1 if identifier == "id0" else 0.05)
+        return f"""<?xml version="1.0" encoding="UTF-8"?>
+<OAI-PMH>
+  <error code="{error_codes[identifier]}">Error for {identifier}</error>
+</OAI-PMH>"""
+
+    manager = ExtractionManager(
+        RepositoryInterface("https://www.lzv.nrw/oai"),
+        harvest_workers=len(error_codes)
+    )
+    with mock.patch.object(
+        manager._repository_interface,
+        "_execute_http_request",
+        side_effect=faked_execute_http_request
+    ):
+        jobid = manager.harvest("oai_dc", _identifiers=list(error_codes))
+        manager.close()
+
+    job = manager.get_job(jobid)
+    errors = [
+        message.body for message in job.log[Context.ERROR]
+        if "GetRecord" in message.body
+    ]
+    assert len(errors) == len(error_codes)
+    for identifier, code in error_codes.items():
+        error = next(error for error in errors if f" {identifier} " in error)
+        assert code in error
+        assert f"Error for {identifier}" in error
+        assert all(
+            other_code not in error
+            for other_code in error_codes.values() if other_code != code
+        )
+
+def test_harvest_overlapping_list_identifiers(simple_manager):
+    """
+    Test for harvest-method in ExtractionManager requesting records of
+    a page while the next page of identifiers is listed.
+    """
+
+    response_pages = {
+        None: (["id0", "id1"], "token0"),
+        "token0": (["id2"], None),
+    }
+    response_identifiers_delay = 0.1
+    get_record_calls_during_listing = []
+
+    def faked_list_identifiers(_resumption_token=None, **kwargs):
+        if _resumption_token is not None:
+            time.sleep(response_identifiers_delay)
+            get_record_calls_during_listing.append(
+                simple_manager._repository_interface.get_record.call_count
+            )
+        return response_pages[_resumption_token]
+
+    with mock.patch.object(
+        simple_manager._repository_interface,
+        "list_identifiers",
+        side_effect=faked_list_identifiers
+    ), mock.patch.object(
+        simple_manager._repository_interface,
+        "get_record",
+        side_effect=lambda metadata_prefix, identifier, _log=None: OAIPMHRecord(identifier)
+    ):
+        jobid = simple_manager.harvest("oai_dc", _use_list_records=False)
+
+        # wait for job to terminate
+        job = simple_manager.get_job(jobid)
+        max_duration = 0.5
+        assert job.wait(timeout=max_duration)
+
+        assert job.complete
+        assert [record.identifier for record in job.records] == \
+            ["id0", "id1", "id2"]
+        assert get_record_calls_during_listing == [2]
+        assert simple_manager._repository_interface.get_record.call_count == 3
+
+def test_harvest_abort_queued_job(fake_interface):
+    """
+    Test for aborting a queued harvest-job in ExtractionManager.
+    """
+
+    a_response_identifiers = ["id0"]
+    b_response_identifiers = ["id1"]
+    response_records_delay = 0.1
+
+    # fake requests taking time to execute via side-effect
+    def faked_get_record(metadata_prefix, identifier, _log=None):
+        time.sleep(response_records_delay)
+        return OAIPMHRecord(identifier)
+
+    manager = ExtractionManager(fake_interface, max_jobs=1)
+    with mock.patch.object(
+        manager._repository_interface,
+        "get_record",
+        side_effect=faked_get_record
+    ):
+        a_jobid = manager.harvest(
+            "oai_dc",
+            _identifiers=a_response_identifiers
+        )
+        b_jobid = manager.harvest(
+            "oai_dc",
+            _identifiers=b_response_identifiers
+        )
+
+        # second job is queued; abort
+        b_thread = manager._running_threads[b_jobid][0]
+        assert not b_thread.running()
+        manager.abort_job(b_jobid)
+        manager.close()
+
+        assert b_thread.cancelled()
+        assert manager.get_job(a_jobid).complete
+        assert not manager.get_job(b_jobid).complete
+        assert not manager.get_job(b_jobid).running
+        assert len(manager.get_job(b_jobid).records) == 0
+        manager._repository_interface.get_record.assert_called_once()
+
+def test_harvest_unexpected_error(simple_manager):
+    """
+    Test for harvest-method in ExtractionManager if the job fails with
+    an unexpected error.
+    """
+
+    with mock.patch.object(
+        simple_manager._repository_interface,
+        "get_record",
+        side_effect=ValueError("malformed response")
+    ):
+        jobid = simple_manager.harvest("oai_dc", _identifiers=["id0"])
+
+        job = simple_manager.get_job(jobid)
+        assert job.wait(timeout=1)
+        assert not job.complete
+        assert not job.running
+        assert "malformed response" in str(job.log)
+        assert "malformed response" in str(simple_manager.log)
+        simple_manager.close()
+        assert jobid not in simple_manager._running_threads
+
 def test_harvest_simultaneous_jobs(simple_manager):
     """
     Test for harvest-method in ExtractionManager.
@@ -266,7 +648,7 @@ def test_harvest_simultaneous_jobs(simple_manager):
     b_response_records_delay = 0.02
 
     # fake requests taking time to execute via side-effect
-    def faked_get_record(metadata_prefix, identifier):
+    def faked_get_record(metadata_prefix, identifier, _log=None):
         if identifier in a_response_identifiers:
             time.sleep(a_response_records_delay)
         else:
@@ -287,10 +669,10 @@ def test_harvest_simultaneous_jobs(simple_manager):
             _identifiers=a_response_identifiers
         )
 
-        time.sleep(a_response_records_delay)
+        time.sleep(0.5 * a_response_records_delay)
 
         # the first job should still be running
-        assert len(threading.enumerate()) == 2
+        assert list(simple_manager._running_threads) == [a_jobid]
 
         # start second harvest-job
         b_jobid = simple_manager.harvest(
@@ -298,7 +680,7 @@ def test_harvest_simultaneous_jobs(simple_manager):
             _identifiers=b_response_identifiers
         )
 
-        assert len(threading.enumerate()) == 3
+        assert list(simple_manager._running_threads) == [a_jobid, b_jobid]
 
         # wait until jobs are finished
         a_job = simple_manager.get_job(a_jobid)
@@ -306,12 +688,8 @@ def test_harvest_simultaneous_jobs(simple_manager):
         max_duration = \
             a_response_records_delay * len(a_response_identifiers) * 2 \
             + b_response_records_delay * len(b_response_identifiers) * 2
-        i = 0
-        while not (a_job.complete and b_job.complete):
-            time.sleep(0.01)
-            i += 1
-            if i > max_duration/0.01:
-                break
+        assert a_job.wait(timeout=max_duration)
+        assert b_job.wait(timeout=max_duration)
 
         # assert results
         for record in a_job.records:
@@ -352,7 +730,7 @@ def test_extract(simple_manager, io_file, check_log):
     # fake requests taking time to execute via side-effect
     def faked_list_identifiers(**kwargs):
         return (response_identifiers, response_token)
-    def faked_get_record(metadata_prefix, identifier):
+    def faked_get_record(metadata_prefix, identifier, _log=None):
         return OAIPMHRecord(identifier)
     def faked_download_record_payload(record, **kwargs):
         record.register_files_by_url([test_url])
@@ -374,8 +752,8 @@ def test_extract(simple_manager, io_file, check_log):
         "get_record",
         side_effect=faked_get_record
     ), mock.patch.object(
-        simple_manager._repository_interface.log,
-        "__str__",
+        simple_manager._repository_interface,
+        "log_oneline",
         side_effect=lambda: ""
     ), mock.patch.object(
         simple_manager._payload_collector,
@@ -394,16 +772,12 @@ def test_extract(simple_manager, io_file, check_log):
             jobid = simple_manager.extract(
                 path=path,
                 metadata_prefix="oai_dc",
-                _verbose_file=_io_file
+                _verbose_file=_io_file,
+                _use_list_records=False
             )
             job = simple_manager.get_job(jobid)
             max_duration = 0.5
-            i = 0
-            while not job.complete:
-                time.sleep(0.01)
-                i += 1
-                if i > max_duration/0.01:
-                    break
+            assert job.wait(timeout=max_duration)
 
             # check briefly for completed job content
             assert len(job.records) == len(response_identifiers)
@@ -444,7 +818,7 @@ def test_extract_urlerror(simple_manager):
     error_msg = "URL error message"
 
     # fake requests taking time to execute via side-effect
-    def faked_get_record(metadata_prefix, identifier):
+    def faked_get_record(metadata_prefix, identifier, _log=None):
         return OAIPMHRecord(identifier)
     def faked_download_record_payload(record, **kwargs):
         record.register_files_by_url([test_url + record.identifier])
@@ -488,12 +862,7 @@ def test_extract_urlerror(simple_manager):
         )
         job = simple_manager.get_job(jobid)
         max_duration = 0.5
-        i = 0
-        while not job.complete:
-            time.sleep(0.01)
-            i += 1
-            if i > max_duration/0.01:
-                break
+        assert job.wait(timeout=max_duration)
 
         #print("")
         #print(log.getvalue())
@@ -512,6 +881,89 @@ def test_extract_urlerror(simple_manager):
         # clean up temporary files
         shutil.rmtree(path)
 
+def test_extract_state_resume(fake_interface, fake_collector, tmp_path):
+    """
+    Test for extract-method in ExtractionManager resuming an extraction
+    that has been aborted during the download via a state-file.
+    """
+
+    requested_identifiers = ["id0", "id1", "id2"]
+    test_url = "http://test/"
+    test_file_name = "test.txt"
+    path = tmp_path / "payload"
+    state_path = tmp_path / "state.json"
+
+    abort = True
+    downloads = []
+    def faked_download_record_payload(record, **kwargs):
+        record.register_files_by_url([test_url + record.identifier])
+    def faked_download_file(path, url):
+        (path / test_file_name).write_text(url, encoding="utf-8")
+        downloads.append(url)
+        # abort job (directory is named after its identifier) after the
+        # first download
+        if abort:
+            manager.abort_job(path.parent.name)
+        return path / test_file_name
+
+    with mock.patch.object(
+        fake_interface,
+        "get_record",
+        side_effect=lambda metadata_prefix, identifier, _log=None: OAIPMHRecord(identifier)
+    ), mock.patch.object(
+        fake_collector,
+        "download_record_payload",
+        side_effect=faked_download_record_payload
+    ), mock.patch.object(
+        fake_collector,
+        "download_file",
+        side_effect=faked_download_file
+    ):
+        manager = ExtractionManager(
+            fake_interface, fake_collector, download_workers=1
+        )
+        jobid = manager.extract(
+            path=path,
+            metadata_prefix="oai_dc",
+            _identifiers=requested_identifiers,
+            _state_path=state_path
+        )
+        manager.close()
+        job = manager.get_job(jobid)
+
+        # only the downloaded record is stored
+        assert not job.complete
+        assert downloads == [test_url + "id0"]
+        assert json.loads(
+            state_path.read_text(encoding="utf-8")
+        )["processed"] == ["id0"]
+
+        # resume
+        abort = False
+        manager = ExtractionManager(
+            fake_interface, fake_collector, download_workers=1
+        )
+        jobid = manager.extract(
+            path=path,
+            metadata_prefix="oai_dc",
+            _identifiers=requested_identifiers,
+            _state_path=state_path
+        )
+        manager.close()
+        job = manager.get_job(jobid)
+
+        # remaining payload is downloaded
+        assert job.complete
+        assert [record.identifier for record in job.records] == ["id1", "id2"]
+        for record in job.records:
+            assert (record.path / test_file_name).read_text(
+                encoding="utf-8"
+            ) == test_url + record.identifier
+        assert downloads == [
+            test_url + identifier for identifier in requested_identifiers
+        ]
+        assert not state_path.exists()
+
 
 @pytest.mark.skip(reason="ExtractionManager is no longer maintained")
 def test_harvest_listidentifiers_http_error(simple_manager, generate_FakeRequestsResponse):
@@ -528,7 +980,7 @@ def test_harvest_listidentifiers_http_error(simple_manager, generate_FakeRequest
     some_extraction_manager = ExtractionManager(some_repository_interface, None)
 
     with mock.patch.object(
-                requests,
+                requests.Session,
                 "get",
                 side_effect=lambda url, *args, **kwargs: generate_FakeRequestsResponse(
                     expected_response,
@@ -542,7 +994,7 @@ def test_harvest_listidentifiers_http_error(simple_manager, generate_FakeRequest
                 # wait for job to terminate
                 max_duration = 0.1
                 i = 0
-                while thread.is_alive():
+                while not thread.done():
                     time.sleep(0.01)
                     i += 1
                     if i > max_duration/0.01:
@@ -569,7 +1021,7 @@ def test_harvest_getrecord_http_error(simple_manager, generate_FakeRequestsRespo
     some_extraction_manager = ExtractionManager(some_repository_interface, None)
 
     with mock.patch.object(
-                requests,
+                requests.Session,
                 "get",
                 side_effect=lambda url, *args, **kwargs: generate_FakeRequestsResponse(
                     expected_response,
@@ -587,7 +1039,7 @@ def test_harvest_getrecord_http_error(simple_manager, generate_FakeRequestsRespo
                 # wait for job to terminate
                 max_duration = 0.1
                 i = 0
-                while thread.is_alive():
+                while not thread.done():
                     time.sleep(0.01)
                     i += 1
                     if i > max_duration/0.01:
@@ -1,5 +1,7 @@
 """Test module for the class Job."""
 
+from threading import Timer
+
 import pytest
 
 from oai_pmh_extractor import OAIPMHRecord
@@ -95,6 +97,16 @@ def test_end(simple_job):
     assert simple_job.complete
     assert simple_job.complete_datetime != "not completed"
 
+def test_wait(simple_job):
+    """Test wait-method."""
+
+    simple_job.start()
+    assert not simple_job.wait(timeout=0.01)
+
+    Timer(0.01, simple_job.end).start()
+    assert simple_job.wait(timeout=1)
+    assert simple_job.complete
+
 def test_add_record(simple_job):
     """Test add_record-method of Job-object."""
 
@@ -131,6 +143,18 @@ def test_add_record_duplicates(simple_job):
     simple_job.add_omitted_record(record2)
     assert len(simple_job.omitted_records) == 1
 
+def test_extend_records(simple_job):
+    """Test extend_records-method of Job-object."""
+
+    simple_job.add_record(OAIPMHRecord("id0"))
+    added_records = simple_job.extend_records(
+        OAIPMHRecord(identifier) for identifier in ["id0", "id1", "id2", "id1"]
+    )
+
+    assert [record.identifier for record in added_records] == ["id1", "id2"]
+    assert [record.identifier for record in simple_job.records] == \
+        ["id0", "id1", "id2"]
+
 def test_omit_record(simple_job):
     """Test omit_record-method of Job-object."""
 
@@ -148,6 +172,24 @@ def test_omit_record(simple_job):
     assert len(simple_job.records) == 1
     assert len(simple_job.omitted_records) == 2
 
+    # order is preserved for records added after omission
+    simple_job.add_record(record2)
+    assert simple_job.records == [record0, record2]
+
+
+def test_number_of_records(simple_job):
+    """Test number_of_records-property of Job-object."""
+
+    records = [OAIPMHRecord("id"+str(i)) for i in range(3)]
+    simple_job.extend_records(records)
+    assert simple_job.number_of_records == 3
+
+    simple_job.omit_record(records[1])
+    assert simple_job.number_of_records == 2
+    # records-list is only rebuilt on access
+    assert simple_job._records_list is None
+    assert simple_job.records == [records[0], records[2]]
+
 
 def test_omit_record_iteration(simple_job):
     """Test omit_record-method of Job-object during iteration."""
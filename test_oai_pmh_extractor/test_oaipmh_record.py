@@ -75,6 +75,14 @@ def test_set_identifier(simple_record):
 
     assert simple_record.identifier == new_id
 
+def test_identifier_hash(simple_record):
+    """Test identifier_hash-property after changing identifier."""
+    old_hash = simple_record.identifier_hash
+    simple_record.identifier = "id2"
+
+    assert simple_record.identifier_hash != old_hash
+    assert simple_record.identifier_hash == OAIPMHRecord("id2").identifier_hash
+
 def test_set_path(simple_record):
     """Test setter function of path-property."""
 
@@ -136,6 +144,16 @@ def test_add_file(simple_record):
     assert new_list == simple_record.files
     assert new_file in simple_record.files
 
+def test_add_file_duplicate(simple_record):
+    """Test add_file of OAIPMHRecord-class for existing identifier."""
+    new_file = SIMPLE_FILES[0].copy()
+    new_file["complete"] = True
+
+    simple_record.add_file(new_file)
+
+    assert len(simple_record.files) == len(SIMPLE_FILES)
+    assert simple_record.files[0]["complete"]
+
 def test_remove_file(simple_record):
     """Test remove_file of OAIPMHRecord-class."""
     removed_file = SIMPLE_FILES[0]
@@ -147,6 +165,27 @@ def test_remove_file(simple_record):
     assert new_list == simple_record.files
     assert removed_file not in simple_record.files
 
+def test_files_cached(simple_record):
+    """Test caching of the list returned by the files-property."""
+    files = simple_record.files
+    assert simple_record.files is files
+
+    # new file is appended to cached list
+    new_file = {
+        "identifier": "https://file3",
+        "url": "https://file3",
+        "path": None,
+        "complete": False
+    }
+    simple_record.add_file(new_file)
+    assert simple_record.files is files
+    assert files[-1] == new_file
+
+    # removing a file yields a new list
+    simple_record.remove_file(new_file)
+    assert simple_record.files is not files
+    assert simple_record.files == SIMPLE_FILES
+
 def test_get_set_complete(simple_record):
     """Test getter and setter function of complete-property."""
     assert not simple_record.complete
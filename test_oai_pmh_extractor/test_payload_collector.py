@@ -1,19 +1,21 @@
 """Test module for the class PayloadCollector."""
 
-from pathlib import Path, PosixPath, WindowsPath
-from time import sleep
+from pathlib import Path
+from time import sleep, monotonic
 import shutil
 from urllib import request
 from unittest import mock
 from uuid import uuid4
 
 import pytest
+import requests
 from flask import Response
 from dcm_common import LoggingContext as Context
 
 from oai_pmh_extractor import (
     PayloadCollector, TransferUrlFilters, OAIPMHRecord
 )
+from oai_pmh_extractor import payload_collector
 
 
 @pytest.mark.parametrize(
@@ -81,6 +83,46 @@ def test_filter_by_regex_in_xml_path_match_anything():
     assert ["asd"] == this_filter("<root><a>asd</a></root>")
 
 
+def test_filter_by_regex_in_xml_path_whitespace():
+    """
+    Test factory `filter_by_regex_in_xml_path` of `TransferUrlFilters`
+    for indented element text.
+
+    Assert surrounding whitespace is stripped.
+    """
+    source_metadata = """<root>
+  <a>
+    https://lzv.nrw/file.pdf
+  </a>
+  <a>
+  </a>
+</root>"""
+
+    assert ["https://lzv.nrw/file.pdf"] == \
+        TransferUrlFilters.filter_by_regex_in_xml_path(
+            ".*", ["root", "a"]
+        )(source_metadata)
+
+
+def test_filter_by_regex_in_xml_path_namespaces():
+    """
+    Test factory `filter_by_regex_in_xml_path` of `TransferUrlFilters`
+    for prefixed element names, repeated elements, and attributes.
+    """
+    source_metadata = """<?xml version="1.0" encoding="ISO-8859-1"?>
+<root xmlns="https://lzv.nrw/a" xmlns:b="https://lzv.nrw/b">
+  <b:c><b:d href="ghi">abc</b:d></b:c>
+  <b:c><b:d>def</b:d></b:c>
+</root>"""
+
+    assert ["abc", "def"] == TransferUrlFilters.filter_by_regex_in_xml_path(
+        "([a-z]+)", ["root", "b:c", "b:d"]
+    )(source_metadata)
+    assert ["ghi"] == TransferUrlFilters.filter_by_regex_in_xml_path(
+        "([a-z]+)", ["root", "b:c", "b:d", "@href"]
+    )(source_metadata)
+
+
 @pytest.mark.parametrize(
     ("source_metadata", "input_regex", "input_xpath", "expected_result"),
     [
@@ -257,6 +299,60 @@ def test_filter_by_regex_with_xpath_query_non_existent_namespace():
     )
 
 
+def test_filters_share_parse():
+    """
+    Test that xml-based filters acting on the same source metadata
+    parse the document only once per call of download_record_payload.
+    """
+
+    source_metadata = """<?xml version="1.0" encoding="UTF-8"?>
+<root xmlns:dc="uri_dc">
+  <dc:identifier>https://a.b/1</dc:identifier>
+  <dc:relation>https://a.b/2</dc:relation>
+</root>"""
+    filters = [
+        TransferUrlFilters.filter_by_regex_in_xml_path(
+            "(.*)", ["root", "dc:identifier"]
+        ),
+        TransferUrlFilters.filter_by_regex_with_xpath_query(
+            "(.*)", "./dc:relation"
+        ),
+    ]
+    collector = PayloadCollector(transfer_url_filters=filters)
+    record = OAIPMHRecord("id0", metadata_raw=source_metadata)
+    with mock.patch(
+        "oai_pmh_extractor.payload_collector.etree.fromstring",
+        side_effect=payload_collector.etree.fromstring
+    ) as fromstring:
+        collector.download_record_payload(record, skip_download=True)
+        assert fromstring.call_count == 1
+        # filters used outside of download_record_payload do not keep
+        # parsed documents
+        results = [this_filter(source_metadata) for this_filter in filters]
+        assert fromstring.call_count == 3
+
+    assert sorted(file["url"] for file in record.files) \
+        == ["https://a.b/1", "https://a.b/2"]
+    assert results == [["https://a.b/1"], ["https://a.b/2"]]
+
+
+def test_filters_share_namespaces():
+    """
+    Test that the namespace map of source metadata is collected once per
+    filter pass.
+    """
+
+    source_metadata = '<root xmlns="uri_default" xmlns:dc="uri_dc"/>'
+    with payload_collector._shared_xml_parse():
+        nsmap = payload_collector._collect_namespaces(source_metadata)
+        assert nsmap[""] == "uri_default"
+        assert nsmap["dc"] == "uri_dc"
+        assert payload_collector._collect_namespaces(source_metadata) \
+            is nsmap
+    assert payload_collector._collect_namespaces(source_metadata) \
+        is not nsmap
+
+
 def test_download_record_payload_for_syntaxerror_in_transfer_url_filter():
     """
     Test method `known download_record_payload` of PayloadCollector class
@@ -364,7 +460,7 @@ def test_download_file_filename_from_header(
     Test the extraction of filenames from header in method download_file
     of PayloadCollector class.
 
-    To this end, patch the urllib.request-library's `urlopen` method to
+    To this end, patch the requests-library's `Session.get` method to
     return stub.
     """
 
@@ -378,30 +474,26 @@ def test_download_file_filename_from_header(
     class MockedResponse():
         def __init__(self, url, *args, **kwargs):
             self.url = url
+            self.headers = {
+                "Content-Disposition":
+                    f'attachment; filename="{test_filename}"'
+            }
         def __enter__(self):
             return self
         def __exit__(self, type, value, traceback):
             pass
-        def read(self):
-            return test_data
-        def info(self):
-            class MockedInfo():
-                def get_filename(self):
-                    return test_filename
-            return MockedInfo()
-
-    # fake urllib and filesystem
-    # for the latter the individual types of paths are mocked
-    # this is needed since pathlib.Path("..") does not necessarily return
-    # Path but likely PosixPath|WindowsPath depending on OS
+        def raise_for_status(self):
+            pass
+        def iter_content(self, *args):
+            yield test_data
+
+    # fake requests
+    TEST_DIRECTORY.mkdir(parents=True, exist_ok=True)
     with mock.patch.object(
-                request,
-                "urlopen",
+                requests.Session,
+                "get",
                 side_effect=lambda url, *args, **kwargs: MockedResponse(url)
-            ), \
-            mock.patch.object(Path, "write_bytes"), \
-            mock.patch.object(PosixPath, "write_bytes"), \
-            mock.patch.object(WindowsPath, "write_bytes"):
+            ):
 
         # download file
         test_url = SIMPLE_TRANSFER_URLS[0]
@@ -410,6 +502,10 @@ def test_download_file_filename_from_header(
 
         assert used_filename.name == test_filename
 
+    # post-test cleanup
+    if TEST_DIRECTORY.is_dir():
+        shutil.rmtree(TEST_DIRECTORY)
+
 
 def test_download_file_filename_from_url(
     simple_payload_collector
@@ -418,7 +514,7 @@ def test_download_file_filename_from_url(
     Test the extraction of filenames from url in method download_file
     of PayloadCollector class.
 
-    To this end, patch the urllib.request-library's `urlopen` method to
+    To this end, patch the requests-library's `Session.get` method to
     return stub.
     """
 
@@ -432,30 +528,23 @@ def test_download_file_filename_from_url(
     class MockedResponse():
         def __init__(self, url, *args, **kwargs):
             self.url = url
+            self.headers = {}
         def __enter__(self):
             return self
         def __exit__(self, type, value, traceback):
             pass
-        def read(self):
-            return test_data
-        def info(self):
-            class MockedInfo():
-                def get_filename(self):
-                    return test_filename
-            return MockedInfo()
-
-    # fake urllib and filesystem
-    # for the latter the individual types of paths are mocked
-    # this is needed since pathlib.Path("..") does not necessarily return
-    # Path but likely PosixPath|WindowsPath depending on OS
+        def raise_for_status(self):
+            pass
+        def iter_content(self, *args):
+            yield test_data
+
+    # fake requests
+    TEST_DIRECTORY.mkdir(parents=True, exist_ok=True)
     with mock.patch.object(
-                request,
-                "urlopen",
+                requests.Session,
+                "get",
                 side_effect=lambda url, *args, **kwargs: MockedResponse(url)
-            ), \
-            mock.patch.object(Path, "write_bytes"), \
-            mock.patch.object(PosixPath, "write_bytes"), \
-            mock.patch.object(WindowsPath, "write_bytes"):
+            ):
 
         # download file
         test_url = "http://domain.com/" + test_filename
@@ -464,6 +553,17 @@ def test_download_file_filename_from_url(
 
         assert used_filename.name in test_url
 
+        # url without filename
+        used_filename = simple_payload_collector.download_file(
+            TEST_DIRECTORY, "http://domain.com/"
+        )
+
+        assert used_filename.name == "download.bin"
+
+    # post-test cleanup
+    if TEST_DIRECTORY.is_dir():
+        shutil.rmtree(TEST_DIRECTORY)
+
 
 def test_download_file_filename_failing(
     simple_payload_collector
@@ -472,8 +572,8 @@ def test_download_file_filename_failing(
     Test the exception behavior of filename extraction in method
     download_file of PayloadCollector class.
 
-    To this end, patch the urllib.request-library's `urlopen` method to
-    return stub and make pathlib.Path.is_file() always return True.
+    To this end, patch the requests-library's `Session.get` method to
+    return stub and create files for all candidate filenames beforehand.
     """
 
     # pre-test cleanup
@@ -486,30 +586,31 @@ def test_download_file_filename_failing(
     class MockedResponse():
         def __init__(self, url, *args, **kwargs):
             self.url = url
+            self.headers = {
+                "Content-Disposition":
+                    f'attachment; filename="{test_filename}"'
+            }
         def __enter__(self):
             return self
         def __exit__(self, type, value, traceback):
             pass
-        def read(self):
-            return test_data
-        def info(self):
-            class MockedInfo():
-                def get_filename(self):
-                    return test_filename
-            return MockedInfo()
-
-    # fake urllib and filesystem
-    # for the latter the individual types of paths are mocked
-    # this is needed since pathlib.Path("..") does not necessarily return
-    # Path but likely PosixPath|WindowsPath depending on OS
+        def raise_for_status(self):
+            pass
+        def iter_content(self, *args):
+            yield test_data
+
+    # fake filesystem
+    TEST_DIRECTORY.mkdir(parents=True, exist_ok=True)
+    (TEST_DIRECTORY / test_filename).touch()
+    for i in range(9):
+        (TEST_DIRECTORY / f"filename_{i}.dat").touch()
+
+    # fake requests
     with mock.patch.object(
-                request,
-                "urlopen",
+                requests.Session,
+                "get",
                 side_effect=lambda url, *args, **kwargs: MockedResponse(url)
-            ), \
-            mock.patch.object(Path, "is_file", side_effect=lambda: True), \
-            mock.patch.object(PosixPath, "is_file", side_effect=lambda: True), \
-            mock.patch.object(WindowsPath, "is_file", side_effect=lambda: True):
+            ):
 
         # download file
         test_url = SIMPLE_TRANSFER_URLS[0]
@@ -517,6 +618,72 @@ def test_download_file_filename_failing(
             simple_payload_collector.download_file(TEST_DIRECTORY, test_url)
 
     assert test_url in simple_payload_collector.log[Context.ERROR][0].body
+    # existing files are not overwritten
+    for file in TEST_DIRECTORY.glob("*"):
+        assert file.read_bytes() == b""
+
+    # post-test cleanup
+    if TEST_DIRECTORY.is_dir():
+        shutil.rmtree(TEST_DIRECTORY)
+
+
+def test_download_file_filename_existing(
+    simple_payload_collector
+):
+    """
+    Test the choice of an alternative filename in method download_file
+    of PayloadCollector class if the file already exists.
+
+    To this end, patch the requests-library's `Session.get` method to
+    return stub.
+    """
+
+    # pre-test cleanup
+    if TEST_DIRECTORY.is_dir():
+        shutil.rmtree(TEST_DIRECTORY)
+
+    # fake response
+    test_data = b"test"
+    test_filename = "filename.dat"
+    class MockedResponse():
+        def __init__(self, url, *args, **kwargs):
+            self.url = url
+            self.headers = {
+                "Content-Disposition":
+                    f'attachment; filename="{test_filename}"'
+            }
+        def __enter__(self):
+            return self
+        def __exit__(self, type, value, traceback):
+            pass
+        def raise_for_status(self):
+            pass
+        def iter_content(self, *args):
+            yield test_data
+
+    # fake filesystem
+    TEST_DIRECTORY.mkdir(parents=True, exist_ok=True)
+    (TEST_DIRECTORY / test_filename).touch()
+
+    # fake requests
+    with mock.patch.object(
+                requests.Session,
+                "get",
+                side_effect=lambda url, *args, **kwargs: MockedResponse(url)
+            ):
+
+        # download file
+        test_url = SIMPLE_TRANSFER_URLS[0]
+        used_filename = \
+            simple_payload_collector.download_file(TEST_DIRECTORY, test_url)
+
+    assert used_filename.name == "filename_0.dat"
+    assert used_filename.read_bytes() == test_data
+    assert (TEST_DIRECTORY / test_filename).read_bytes() == b""
+
+    # post-test cleanup
+    if TEST_DIRECTORY.is_dir():
+        shutil.rmtree(TEST_DIRECTORY)
 
 
 def test_download_file_filename_override(
@@ -526,7 +693,7 @@ def test_download_file_filename_override(
     Test the filename-override in method download_file of PayloadCollector
     class.
 
-    To this end, patch the urllib.request-library's `urlopen` method to
+    To this end, patch the requests-library's `Session.get` method to
     return stub.
     """
 
@@ -541,30 +708,26 @@ def test_download_file_filename_override(
     class MockedResponse():
         def __init__(self, url, *args, **kwargs):
             self.url = url
+            self.headers = {
+                "Content-Disposition":
+                    f'attachment; filename="{test_filename}"'
+            }
         def __enter__(self):
             return self
         def __exit__(self, type, value, traceback):
             pass
-        def read(self):
-            return test_data
-        def info(self):
-            class MockedInfo():
-                def get_filename(self):
-                    return test_filename
-            return MockedInfo()
-
-    # fake urllib and filesystem
-    # for the latter the individual types of paths are mocked
-    # this is needed since pathlib.Path("..") does not necessarily return
-    # Path but likely PosixPath|WindowsPath depending on OS
+        def raise_for_status(self):
+            pass
+        def iter_content(self, *args):
+            yield test_data
+
+    # fake requests
+    TEST_DIRECTORY.mkdir(parents=True, exist_ok=True)
     with mock.patch.object(
-                request,
-                "urlopen",
+                requests.Session,
+                "get",
                 side_effect=lambda url, *args, **kwargs: MockedResponse(url)
-            ), \
-            mock.patch.object(Path, "write_bytes"), \
-            mock.patch.object(PosixPath, "write_bytes"), \
-            mock.patch.object(WindowsPath, "write_bytes"):
+            ):
 
         # download file
         test_url = SIMPLE_TRANSFER_URLS[0]
@@ -575,13 +738,24 @@ def test_download_file_filename_override(
 
         assert used_filename.name == actual_filename
 
+        # no alternative filename for explicit override
+        with pytest.raises(FileExistsError):
+            simple_payload_collector.download_file(
+                TEST_DIRECTORY, test_url, Path(actual_filename)
+            )
+        assert len(list(TEST_DIRECTORY.iterdir())) == 1
+
+    # post-test cleanup
+    if TEST_DIRECTORY.is_dir():
+        shutil.rmtree(TEST_DIRECTORY)
+
 
 def test_download_file_faked(simple_payload_collector):
     """
     Test method download_file of PayloadCollector class.
 
-    To this end, patch the urllib.request-library's `urlopen` method to
-    return stub. Evaluate number of calls and arguments afterwards.
+    To this end, patch the requests-library's `Session.get` method to
+    return stub. Evaluate the written file afterwards.
     """
 
     # pre-test cleanup
@@ -594,47 +768,37 @@ def test_download_file_faked(simple_payload_collector):
     class MockedResponse():
         def __init__(self, url, *args, **kwargs):
             self.url = url
+            self.headers = {
+                "Content-Disposition":
+                    f'attachment; filename="{test_filename}"'
+            }
         def __enter__(self):
             return self
         def __exit__(self, type, value, traceback):
             pass
-        def read(self):
-            return test_data
-        def info(self):
-            class MockedInfo():
-                def get_filename(self):
-                    return test_filename
-            return MockedInfo()
-    # fake urllib and filesystem
-    # for the latter the individual types of paths are mocked
-    # this is needed since pathlib.Path("..") does not necessarily return
-    # Path but likely PosixPath|WindowsPath depending on OS
+        def raise_for_status(self):
+            pass
+        def iter_content(self, *args):
+            yield test_data
+    # fake requests
+    TEST_DIRECTORY.mkdir(parents=True, exist_ok=True)
     with mock.patch.object(
-                request,
-                "urlopen",
+                requests.Session,
+                "get",
                 side_effect=lambda url, *args, **kwargs: MockedResponse(url)
-            ), \
-            mock.patch.object(Path, "write_bytes"), \
-            mock.patch.object(PosixPath, "write_bytes"), \
-            mock.patch.object(WindowsPath, "write_bytes"):
+            ):
 
         # download file
         test_url = SIMPLE_TRANSFER_URLS[0]
         simple_payload_collector.download_file(TEST_DIRECTORY, test_url)
 
         # assert single file has been written
-        called_path_class = None
-        total_call_count = 0
-        for path_class in [Path, PosixPath, WindowsPath]:
-            total_call_count += path_class.write_bytes.call_count
-            if path_class.write_bytes.call_count > 0:
-                called_path_class = path_class
-        assert total_call_count == 1
-        assert called_path_class is not None
+        assert len(list(TEST_DIRECTORY.glob("*"))) == 1
+        assert (TEST_DIRECTORY / test_filename).read_bytes() == test_data
 
-        # test arguments
-        written_content = called_path_class.write_bytes.call_args_list[0][0][0]
-        assert written_content == MockedResponse(SIMPLE_TRANSFER_URLS[0]).read()
+    # post-test cleanup
+    if TEST_DIRECTORY.is_dir():
+        shutil.rmtree(TEST_DIRECTORY)
 
 
 # switch these two lines to in-/exclude this test in suite
@@ -788,6 +952,39 @@ def test_download_record_payload_renew_urls():
             len(MORE_TRANSFER_URLS)
 
 
+def test_download_record_payload_concurrent():
+    """
+    Test method download_record_payload of PayloadCollector class for
+    concurrent downloads.
+
+    To this end, patch the download_file-method to take some time.
+    Evaluate duration afterwards.
+    """
+
+    TRANSFER_URLS = ["1", "2", "3", "4"]
+    delay = 0.2
+
+    some_payload_collector = PayloadCollector(
+        lambda x: [], download_workers=len(TRANSFER_URLS)
+    )
+    with mock.patch.object(
+        some_payload_collector,
+        "download_file",
+        side_effect=lambda path, url: sleep(delay)
+    ):
+        record = OAIPMHRecord("", file_urls=TRANSFER_URLS)
+        time0 = monotonic()
+        some_payload_collector.download_record_payload(
+            record=record,
+            path=TEST_DIRECTORY
+        )
+        assert monotonic() - time0 < 2*delay
+        for file in record.files:
+            assert file["complete"]
+        assert some_payload_collector.download_file.call_count == \
+            len(TRANSFER_URLS)
+
+
 def test_download_record_payload_no_files():
     """
     Test method download_record_payload of PayloadCollector class
@@ -1001,3 +1198,33 @@ def test_payload_collector_timeout(latency, run_service):
     # post-test cleanup
     if TEST_DIRECTORY.is_dir():
         shutil.rmtree(TEST_DIRECTORY)
+
+
+def test_download_file_http_error(run_service):
+    """
+    Test method download_file of PayloadCollector class for http-errors
+    by faking a minimal http-server.
+    """
+    # pre-test cleanup
+    if TEST_DIRECTORY.is_dir():
+        shutil.rmtree(TEST_DIRECTORY)
+    TEST_DIRECTORY.mkdir(parents=True)
+
+    # setup fake server
+    run_service(
+        routes=[("/", lambda: Response("not found", status=404), ["GET"])],
+        port=8080
+    )
+
+    # perform test
+    some_payload_collector = PayloadCollector(lambda x: [])
+    with pytest.raises(request.HTTPError) as exc_info:
+        some_payload_collector.download_file(
+            TEST_DIRECTORY, url="http://localhost:8080"
+        )
+    assert exc_info.value.code == 404
+    assert list(TEST_DIRECTORY.glob("*")) == []
+
+    # post-test cleanup
+    if TEST_DIRECTORY.is_dir():
+        shutil.rmtree(TEST_DIRECTORY)
@@ -1,7 +1,7 @@
 """Test module for the class RepositoryInterface."""
 
 from unittest import mock
-from time import sleep
+from time import sleep, monotonic
 
 import requests
 import pytest
@@ -68,6 +68,18 @@ def test__build_request_missing_question_mark(simple_interface):
     expected_url = base + _build_request_options(options)
     assert expected_url == request_url
 
+def test__build_request_encoding(simple_interface):
+    """
+    Test _build_request-method of RepositoryInterface for url-encoding
+    of values.
+    """
+
+    request_url = simple_interface._build_request(
+        set="a:b", resumptionToken="c/d&e=f g+h"
+    )
+    assert request_url == simple_interface._base_url \
+        + "?set=a:b&resumptionToken=c/d%26e%3Df+g%2Bh"
+
 def test_identify(simple_interface, generate_FakeRequestsResponse):
     """
     Test identify-method of RepositoryInterface.
@@ -79,13 +91,13 @@ def test_identify(simple_interface, generate_FakeRequestsResponse):
         "verb": "Identify"
     }
 
-    # define requests.get-stub
+    # define requests.Session.get-stub
     expected_response = b"<test_tag>value</test_tag>"
     expected_response_dict = {"test_tag": "value"}
 
     # use fake-setup for test
     with mock.patch.object(
-                requests,
+                requests.Session,
                 "get",
                 side_effect=lambda url, *args, **kwargs: generate_FakeRequestsResponse(expected_response)
             ), \
@@ -111,7 +123,7 @@ def test_list_metadata_formats(simple_interface, generate_FakeRequestsResponse):
         "verb": "ListMetadataFormats"
     }
 
-    # define requests.get-stub
+    # define requests.Session.get-stub
     fake_response = b"""<OAI-PMH>
 <ListMetadataFormats>
 <metadataFormat>
@@ -146,7 +158,7 @@ def test_list_metadata_formats(simple_interface, generate_FakeRequestsResponse):
 
     # use fake-setup for test
     with mock.patch.object(
-                requests,
+                requests.Session,
                 "get",
                 side_effect=lambda url, *args, **kwargs: generate_FakeRequestsResponse(fake_response)
             ), \
@@ -173,7 +185,7 @@ def test_list_metadata_prefixes(simple_interface, generate_FakeRequestsResponse)
         "verb": "ListMetadataFormats"
     }
 
-    # define requests.get-stub
+    # define requests.Session.get-stub
     fake_response = b"""<OAI-PMH>
 <ListMetadataFormats>
 <metadataFormat>
@@ -197,7 +209,7 @@ def test_list_metadata_prefixes(simple_interface, generate_FakeRequestsResponse)
 
     # use fake-setup for test
     with mock.patch.object(
-                requests,
+                requests.Session,
                 "get",
                 side_effect=lambda url, *args, **kwargs: generate_FakeRequestsResponse(fake_response)
             ), \
@@ -304,7 +316,7 @@ def test_list_identifiers_parameterized(
 
     # use fake-setup for test
     with mock.patch.object(
-                requests,
+                requests.Session,
                 "get",
                 side_effect=lambda url, *args, **kwargs: generate_FakeRequestsResponse(fake_response)
             ), \
@@ -325,14 +337,104 @@ def test_list_identifiers_parameterized(
         simple_interface._build_request.assert_called_once_with(**request_options)
 
 
+def test_list_headers(simple_interface):
+    """Test list_headers-method of RepositoryInterface."""
+
+    fake_response = """<?xml version="1.0" encoding="UTF-8"?>
+<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">
+  <ListIdentifiers>
+    <header>
+      <identifier>id0</identifier>
+      <datestamp>2024-01-01</datestamp>
+    </header>
+    <header>
+      <identifier>id1</identifier>
+    </header>
+    <resumptionToken>token0</resumptionToken>
+  </ListIdentifiers>
+</OAI-PMH>"""
+
+    # use fake-setup for test
+    with mock.patch.object(
+        simple_interface,
+        "_execute_http_request_raw",
+        side_effect=lambda url: fake_response.encode("utf-8")
+    ):
+        headers, token = simple_interface.list_headers("oai_dc")
+
+    assert headers == [("id0", "2024-01-01"), ("id1", None)]
+    assert token == "token0"
+
+
+def test_list_headers_declared_encoding(simple_interface):
+    """
+    Test list_headers-method of RepositoryInterface for a response with
+    a declared encoding other than utf-8.
+    """
+
+    fake_response = """<?xml version="1.0" encoding="ISO-8859-1"?>
+<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">
+  <ListIdentifiers>
+    <header>
+      <identifier>id-äöü</identifier>
+    </header>
+  </ListIdentifiers>
+</OAI-PMH>"""
+
+    with mock.patch.object(
+        simple_interface,
+        "_execute_http_request_raw",
+        side_effect=lambda url: fake_response.encode("iso-8859-1")
+    ):
+        headers, _ = simple_interface.list_headers("oai_dc")
+
+    assert headers == [("id-äöü", None)]
+
+
+@pytest.mark.parametrize(
+    ("method", "kwargs"),
+    [
+        ("list_identifiers", {"_metadata_prefix": "oai_dc"}),
+        ("list_sets", {}),
+        ("list_records_bulk", {"metadata_prefix": "oai_dc"}),
+    ],
+    ids=["list_identifiers", "list_sets", "list_records_bulk"]
+)
+def test_log_preserved_for_resumption_token(simple_interface, method, kwargs):
+    """
+    Test that the log of RepositoryInterface is not cleared by requests
+    continuing a listing with a resumption token.
+    """
+
+    fake_response = """<?xml version="1.0" encoding="UTF-8"?>
+<OAI-PMH>
+  <error code="errorCode">Short Description</error>
+</OAI-PMH>"""
+
+    with mock.patch.object(
+        simple_interface,
+        "_execute_http_request_raw",
+        side_effect=lambda url: fake_response.encode("utf-8")
+    ):
+        getattr(simple_interface, method)(**kwargs)
+        assert len(simple_interface.log[Context.ERROR]) == 1
+        # continue listing
+        getattr(simple_interface, method)(_resumption_token="token0")
+        assert len(simple_interface.log[Context.ERROR]) == 2
+        # new listing
+        getattr(simple_interface, method)(**kwargs)
+        assert len(simple_interface.log[Context.ERROR]) == 1
+
+
 @pytest.mark.parametrize(
     ("_set_spec", "expected_result", "expected_calls"),
     [
         (["set1", "set2", "set3"], ["1", "2", "3"], 3),
         (None, ["1"], 1),
+        (["set1"], ["1"], 1),
         ([], [], 0),
     ],
-    ids=["multiple sets", "none", "empty list"]
+    ids=["multiple sets", "none", "single set", "empty list"]
 )
 def test_list_identifiers_exhaustive_multiple_sets(
     simple_interface, _set_spec, expected_result, expected_calls
@@ -404,7 +506,7 @@ def test_list_identifiers_resumption_token(simple_interface, generate_FakeReques
         "resumptionToken": "x"
     }
 
-    # define requests.get-stub
+    # define requests.Session.get-stub
     fake_response = b"""<OAI-PMH>
 <ListIdentifiers>
     <header>
@@ -418,7 +520,7 @@ def test_list_identifiers_resumption_token(simple_interface, generate_FakeReques
 
     # use fake-setup for test
     with mock.patch.object(
-                requests,
+                requests.Session,
                 "get",
                 side_effect=lambda url, *args, **kwargs: generate_FakeRequestsResponse(fake_response)
             ), \
@@ -525,7 +627,7 @@ def test_list_sets(
 
     # use fake-setup for test
     with mock.patch.object(
-                requests,
+                requests.Session,
                 "get",
                 side_effect=lambda url, *args, **kwargs: generate_FakeRequestsResponse(fake_response)
             ), \
@@ -632,7 +734,7 @@ def test_get_record(
 
     # use fake-setup for test
     with mock.patch.object(
-                requests,
+                requests.Session,
                 "get",
                 side_effect=lambda url, *args, **kwargs: generate_FakeRequestsResponse(fake_response)
             ), \
@@ -651,6 +753,31 @@ def test_get_record(
 
         simple_interface._build_request.assert_called_once_with(**request_options)
 
+def test_iter_identifiers(simple_interface):
+    """Test iter_identifiers-method of RepositoryInterface."""
+
+    pages = {
+        None: (["id0", "id1"], "token0"),
+        "token0": (["id2"], "token1"),
+        "token1": ([], "token1"),  # error
+    }
+
+    with mock.patch.object(
+        simple_interface,
+        "list_identifiers",
+        side_effect=lambda _resumption_token, **kwargs: pages[_resumption_token]
+    ):
+        identifiers = simple_interface.iter_identifiers("oai_dc")
+
+        # requests are made lazily
+        assert simple_interface.list_identifiers.call_count == 0
+        assert next(identifiers) == "id0"
+        assert simple_interface.list_identifiers.call_count == 1
+
+        # iteration stops on error
+        assert list(identifiers) == ["id1", "id2"]
+        assert simple_interface.list_identifiers.call_count == 3
+
 def test_list_records(simple_interface):
     """Test list_records-method of RepositoryInterface."""
 
@@ -666,7 +793,7 @@ def test_list_records(simple_interface):
         mock.patch.object(
                 simple_interface,
                 "get_record",
-                side_effect=lambda metadata_prefix, identifier: OAIPMHRecord(identifier)
+                side_effect=lambda metadata_prefix, identifier, _log=None: OAIPMHRecord(identifier)
             ):
         # execute in RepositoryInterface
         test_response, test_resumption_token = \
@@ -682,6 +809,93 @@ def test_list_records(simple_interface):
         assert simple_interface.list_identifiers.call_count == 1
         assert simple_interface.get_record.call_count == len(fake_ids)
 
+@pytest.mark.parametrize(
+    "failing_id",
+    [None, "id3"],
+    ids=["success", "error"]
+)
+def test_list_records_concurrent(failing_id):
+    """
+    Test list_records-method of RepositoryInterface with concurrent
+    GetRecord-requests.
+    """
+
+    interface = RepositoryInterface("https://www.lzv.nrw/oai", record_workers=4)
+    fake_ids = [f"id{i}" for i in range(10)]
+
+    def get_record(metadata_prefix, identifier, _log=None):
+        # finish requests in reverse order
+        sleep(0.01 * (len(fake_ids) - int(identifier[2:])))
+        if identifier == failing_id:
+            return None
+        return OAIPMHRecord(identifier)
+
+    with mock.patch.object(
+                interface,
+                "list_identifiers",
+                side_effect=lambda **kwargs: (fake_ids, "token1")
+            ), \
+        mock.patch.object(interface, "get_record", side_effect=get_record):
+        test_response, test_resumption_token = interface.list_records(
+            "oai_dc", _resumption_token="token0"
+        )
+
+    if failing_id is None:
+        assert [record.identifier for record in test_response] == fake_ids
+        assert test_resumption_token == "token1"
+    else:
+        assert test_response == []
+        assert test_resumption_token == "token0"
+
+def test_list_records_bulk(simple_interface):
+    """Test list_records_bulk-method of RepositoryInterface."""
+
+    resumption_token = "token0"
+    fake_response = f"""<?xml version="1.0" encoding="UTF-8"?>
+<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">
+  <responseDate>2024-01-01T00:00:00Z</responseDate>
+  <request verb="ListRecords" metadataPrefix="oai_dc">https://www.lzv.nrw/oai</request>
+  <ListRecords>
+    <record>
+      <header>
+        <identifier>id0</identifier>
+        <datestamp>2024-01-01</datestamp>
+      </header>
+      <metadata><a>ä</a></metadata>
+    </record>
+    <record>
+      <header status="deleted">
+        <identifier>id1</identifier>
+      </header>
+    </record>
+    <resumptionToken> {resumption_token} </resumptionToken>
+  </ListRecords>
+</OAI-PMH>"""
+
+    # use fake-setup for test
+    with mock.patch.object(
+        simple_interface,
+        "_execute_http_request_raw",
+        side_effect=lambda url: fake_response.encode("utf-8")
+    ):
+        # execute in RepositoryInterface
+        test_response, test_resumption_token = \
+            simple_interface.list_records_bulk("oai_dc")
+
+    # assert behavior
+    assert test_resumption_token == resumption_token
+    assert [record.identifier for record in test_response] == ["id0", "id1"]
+    assert [record.status for record in test_response] == ["", "deleted"]
+    assert [record.datestamp for record in test_response] == \
+        ["2024-01-01", None]
+    assert Context.WARNING in simple_interface.log
+
+    # source metadata has the format of a GetRecord-response
+    metadata = xmltodict.parse(test_response[0].metadata_raw)
+    assert metadata["OAI-PMH"]["request"]["@verb"] == "GetRecord"
+    assert metadata["OAI-PMH"]["request"]["@identifier"] == "id0"
+    assert metadata["OAI-PMH"]["GetRecord"]["record"]["metadata"]["a"] == "ä"
+
 def test__check_for_oaipmh_errors(simple_interface):
     """Test internal-method _check_for_oaipmh_errors of RepositoryInterface."""
 
@@ -704,6 +918,115 @@ def test__check_for_oaipmh_errors(simple_interface):
     assert fake_code in simple_interface.log[Context.ERROR][0].body
     assert fake_message in simple_interface.log[Context.ERROR][0].body
 
+def test_log_oneline(simple_interface):
+    """Test log_oneline-method of RepositoryInterface."""
+
+    assert simple_interface.log_oneline() == ""
+
+    simple_interface.log.log(Context.ERROR, body="error 1")
+    simple_interface.log.log(Context.ERROR, body="error 2")
+
+    assert "\n" not in simple_interface.log_oneline()
+    assert simple_interface.log_oneline() == \
+        str(simple_interface.log).replace("\n", " ")
+
+def test_close(simple_interface):
+    """Test close-method of RepositoryInterface."""
+
+    with mock.patch.object(
+        simple_interface._session, "close"
+    ) as close:
+        simple_interface.close()
+    close.assert_called_once()
+
+def test_max_requests_per_second(generate_FakeRequestsResponse):
+    """Test rate limit of requests in RepositoryInterface."""
+
+    interface = RepositoryInterface(
+        "https://www.lzv.nrw/oai", max_requests_per_second=20
+    )
+    with mock.patch.object(
+        requests.Session,
+        "get",
+        side_effect=lambda url, *args, **kwargs:
+            generate_FakeRequestsResponse(b"<test_tag>value</test_tag>")
+    ):
+        time0 = monotonic()
+        for _ in range(5):
+            interface.identify()
+        assert monotonic() - time0 >= 0.2
+
+def test_cache_ttl(generate_FakeRequestsResponse):
+    """Test caching of responses in RepositoryInterface."""
+
+    interface = RepositoryInterface("https://www.lzv.nrw/oai", cache_ttl=0.1)
+    with mock.patch.object(
+        requests.Session,
+        "get",
+        side_effect=lambda url, *args, **kwargs:
+            generate_FakeRequestsResponse(b"<test_tag>value</test_tag>")
+    ) as get:
+        assert interface.identify() == interface.identify()
+        assert get.call_count == 1
+
+        # other request
+        interface.list_metadata_formats()
+        interface.list_metadata_formats()
+        assert get.call_count == 2
+
+        # expired
+        sleep(0.1)
+        interface.identify()
+        assert get.call_count == 3
+
+        # cleared
+        interface.clear_cache()
+        interface.identify()
+        assert get.call_count == 4
+
+def test_cache_eviction(generate_FakeRequestsResponse):
+    """Test eviction of cached responses in RepositoryInterface."""
+
+    interface = RepositoryInterface("https://www.lzv.nrw/oai", cache_ttl=0.1)
+    interface.CACHE_SIZE = 2
+    with mock.patch.object(
+        requests.Session,
+        "get",
+        side_effect=lambda url, *args, **kwargs:
+            generate_FakeRequestsResponse(b"<test_tag>value</test_tag>")
+    ):
+        # size is limited (oldest response is evicted)
+        interface.list_sets(_resumption_token="token0")
+        interface.list_sets(_resumption_token="token1")
+        interface.list_sets(_resumption_token="token2")
+        assert len(interface._cache) == 2
+        assert not any("token0" in url for url in interface._cache)
+
+        # expired responses are evicted
+        sleep(0.1)
+        interface.identify()
+        assert len(interface._cache) == 1
+
+def test_cache_oaipmh_error(generate_FakeRequestsResponse):
+    """
+    Test that responses containing an OAI-PMH-error are not cached in
+    RepositoryInterface.
+    """
+
+    interface = RepositoryInterface("https://www.lzv.nrw/oai", cache_ttl=10)
+    with mock.patch.object(
+        requests.Session,
+        "get",
+        side_effect=lambda url, *args, **kwargs:
+            generate_FakeRequestsResponse(
+                b'<OAI-PMH><error code="noSetHierarchy">No sets</error></OAI-PMH>'
+            )
+    ) as get:
+        assert interface.list_sets() == ([], None)
+        assert interface.list_sets() == ([], None)
+        assert get.call_count == 2
+        assert len(interface._cache) == 0
+
 @pytest.mark.parametrize(
     ("method", "kwargs", "expected_return"),
     [
@@ -737,10 +1060,15 @@ def test__check_for_oaipmh_errors(simple_interface):
             {"metadata_prefix": ""},
             ([], None)
         ),
+        (
+            "list_records_bulk",
+            {"metadata_prefix": ""},
+            ([], None)
+        ),
     ],
     ids=[
         "list_metadata_formats", "list_metadata_prefixes", "list_identifiers",
-        "list_sets", "get_record", "list_records"
+        "list_sets", "get_record", "list_records", "list_records_bulk"
     ]
 )
 def test_methods_with_error(
@@ -757,11 +1085,11 @@ def test_methods_with_error(
   <error code="{fake_error_code}">{fake_error_message}</error>
 </OAI-PMH>"""
 
-    # fake _execute_http_request
+    # fake _execute_http_request_raw
     with mock.patch.object(
                 simple_interface,
-                "_execute_http_request",
-                side_effect=lambda request_url: fake_response
+                "_execute_http_request_raw",
+                side_effect=lambda request_url: fake_response.encode("utf-8")
             ):
         # check state of log before request
         assert len(simple_interface.log.report) == 0
@@ -786,7 +1114,7 @@ def test__execute_http_request_error(generate_FakeRequestsResponse):
     requests-library internally.
     """
 
-    # define requests.get-stub
+    # define requests.Session.get-stub
     expected_response = b""
     expected_error_code = 500
     expected_error_msg = "Internal Server Error"
@@ -794,7 +1122,7 @@ def test__execute_http_request_error(generate_FakeRequestsResponse):
 
     # use fake-setup for test
     with mock.patch.object(
-                requests,
+                requests.Session,
                 "get",
                 side_effect=lambda url, *args, **kwargs: generate_FakeRequestsResponse(
                     expected_response,
@@ -808,6 +1136,42 @@ def test__execute_http_request_error(generate_FakeRequestsResponse):
         assert expected_error_msg in str(exc_info)
 
 
+@pytest.mark.parametrize(
+    ("retry_after", "expected_delay"),
+    [
+        (None, 0.1),
+        ("2", 2),
+        ("1000", RepositoryInterface.MAX_RETRY_AFTER),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0.1),
+        ("invalid", 0.1),
+    ],
+    ids=["no-header", "seconds", "exceeding-limit", "past-date", "invalid"]
+)
+def test__execute_http_request_retry_after(
+    retry_after, expected_delay, generate_FakeRequestsResponse
+):
+    """
+    Test internal method _execute_http_request for 'Retry-After'-header.
+    """
+
+    def fake_response(*args, **kwargs):
+        response = generate_FakeRequestsResponse(b"", (503, "Unavailable"))
+        response.headers = (
+            {} if retry_after is None else {"Retry-After": retry_after}
+        )
+        return response
+
+    some_repository_interface = RepositoryInterface("", retry_interval=0.1)
+    with mock.patch.object(
+        requests.Session, "get", side_effect=fake_response
+    ), mock.patch(
+        "oai_pmh_extractor.repository_interface.sleep"
+    ) as fake_sleep:
+        with pytest.raises(requests.exceptions.RequestException):
+            some_repository_interface._execute_http_request("")
+    fake_sleep.assert_called_once_with(expected_delay)
+
+
 @pytest.mark.parametrize(
     "latency",
     [0, 0.1],